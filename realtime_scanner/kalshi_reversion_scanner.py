@@ -13,31 +13,78 @@ Uses RSA-PSS signing for Kalshi API authentication.
 """
 
 import asyncio
+import atexit
 import base64
-import json
+import calendar
+import collections
+import contextlib
+import functools
+import heapq
+import itertools
+import logging
+import operator
 import os
+import queue
+import re
+import sys
+import threading
 import time
 import uuid
+import orjson
 import requests
-from datetime import datetime, timezone, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 from telegram import Bot
+from telegram.request import HTTPXRequest
 
 # =====================================================================
 # CONFIG
 # =====================================================================
 
-env_file = Path(__file__).parent / '.env'
-if env_file.exists():
+@functools.lru_cache(maxsize=1)
+def _load_env_file():
+    """Load .env once per process. Variables already set in the environment
+    (e.g. on Railway) take precedence over the file."""
+    env_file = Path(__file__).parent / '.env'
+    if not env_file.exists():
+        return
     with open(env_file) as f:
         for line in f:
             line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                if value:
-                    os.environ[key] = value
+            if not line or line.startswith('#'):
+                continue
+            key, sep, value = line.partition('=')
+            if sep and value and key not in os.environ:
+                os.environ[key] = value
+
+
+_load_env_file()
+
+
+def _setup_log():
+    """Loggers for the order path ('kalshi.exec') and the API client
+    ('kalshi.api'). Records are written synchronously to stdout, so they stay
+    in order with the scanner's print() status lines.
+    LOG_LEVEL sets both; EXEC_LOG_LEVEL overrides the order path."""
+    parent = logging.getLogger('kalshi')
+    parent.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+    parent.propagate = False
+    sink = logging.StreamHandler(sys.stdout)
+    sink.setFormatter(logging.Formatter('%(message)s'))
+    parent.addHandler(sink)
+    exec_log = logging.getLogger('kalshi.exec')
+    if os.environ.get('EXEC_LOG_LEVEL'):
+        exec_log.setLevel(os.environ['EXEC_LOG_LEVEL'].upper())
+    return exec_log, logging.getLogger('kalshi.api')
+
+
+log, api_log = _setup_log()
 
 TELEGRAM_BOT_TOKEN = os.environ.get('TELEGRAM_BOT_TOKEN', '')
 TELEGRAM_CHAT_ID = os.environ.get('TELEGRAM_CHAT_ID', '')
@@ -49,6 +96,16 @@ KALSHI_PRIVATE_KEY = os.environ.get('KALSHI_PRIVATE_KEY', '')  # Raw PEM content
 KALSHI_PRIVATE_KEY_B64 = os.environ.get('KALSHI_PRIVATE_KEY_B64', '')  # Base64-encoded PEM (for Railway)
 
 KALSHI_BASE = 'https://api.elections.kalshi.com/trade-api/v2'
+HTTP_POOL_MAXSIZE = 32        # Keep-alive connections to the Kalshi host
+HTTP_MAX_RETRIES = 2          # Transport retries on connect errors / 429 / 5xx
+HTTP_WORKERS = 8              # Concurrent lookups for bulk market/event prefetch
+MARKETS_BATCH_SIZE = 100      # Tickers per /markets?tickers= refresh request
+MARKETS_PAGE_LIMIT = 1000     # API max page size for the open-markets scan (fewer sequential pages)
+MARKETS_MAX_OPEN = 40_000     # Open-markets scan stops after this many markets
+ORDERBOOK_CACHE_TTL = 2       # Seconds a fetched orderbook is reused
+QUOTE_HINT_MAX_AGE = 60       # Max age of a cached market quote used as a slippage pre-check
+KEEPALIVE_INTERVAL_SECONDS = 25  # Ping between scans so order calls reuse a warm TLS connection
+TELEGRAM_POOL_SIZE = 8        # Concurrent Telegram sends (alerts are fired as background tasks)
 
 # Strategy params (adapted from Polymarket backtest)
 MIN_SMALL_TRADES = 12       # Min number of small trades on one side
@@ -64,6 +121,8 @@ COOLDOWN_HOURS = 4
 # Scanner settings
 SCAN_INTERVAL_SECONDS = 300  # 5 min
 TRADES_PER_PAGE = 1000
+TRADE_MAX_PAGES = 50          # Page budget per scan, shared by all shards
+TRADE_FETCH_SHARDS = 8        # Time slices of the trade window fetched in parallel
 WINDOW_MINUTES = 60          # 1-hour signal windows
 
 # Trading config
@@ -71,9 +130,11 @@ DRY_RUN = False
 MAX_BET_DOLLARS = 3           # Max per signal
 MIN_BET_DOLLARS = 1           # Skip if depth too thin
 DEPTH_FRACTION = 0.50         # Use 50% of 3-level depth
+DEPTH_LEVELS = 3              # Orderbook levels counted toward depth
 MAX_OPEN_POSITIONS = 20       # Cap concurrent reversion positions
 MAX_IMPL_POSITIONS = 5        # Cap concurrent implied prob positions
-ORDER_WAIT_SECONDS = 5        # Wait for fill after placing order
+ORDER_WAIT_SECONDS = 5        # Max wait for fill after placing order
+ORDER_POLL_DELAYS = (0.1, 0.2, 0.4, 0.8, 1.6)  # Fill-poll backoff; last delay repeats
 MAX_ORDER_RETRIES = 2         # Retry at next price level
 MAX_SLIPPAGE_PCT = 15.0       # Skip if NO price > 15% worse than signal
 
@@ -104,7 +165,8 @@ EXCLUDED_PREFIXES = [
     # Financials (22% WR, -18.6% avg ROI in backtest)
     'KXINX', 'KXNASDAQ', 'KXSP5', 'KXWTI', 'KXINXU',
 ]
-EXCLUDED_CATEGORIES = {'Sports', 'Crypto', 'Financials'}
+EXCLUDED_PREFIX_TUPLE = tuple(EXCLUDED_PREFIXES)
+EXCLUDED_CATEGORIES = frozenset({'Sports', 'Crypto', 'Financials'})
 
 # 60d backtest: SELL +24.4% avg ROI vs BUY -6.8% — only fade buying surges
 SELL_ONLY = True
@@ -131,19 +193,110 @@ MENTION_KEYWORDS = [
     'state of the', 'remarks at', 'remarks during',
 ]
 
+# Independent props (spread, total, 1H, over/under). NOT mutually exclusive —
+# Kalshi groups them under one event but "Kansas wins by 3.5" and
+# "Over 145.5 total" are independent bets.
+IMPL_PROP_KEYWORDS = [
+    'over ', 'under ', 'by over', 'by under', 'spread',
+    'total', 'points', '1h ', '1st half', '2nd half',
+    'first half', 'second half', 'quarter', 'inning',
+    'half time', 'halftime',
+]
+
+# Each keyword list as one compiled alternation: a single scan per title
+# instead of one substring search per keyword. Matched against lowercased text.
+IMPL_PROP_RE = re.compile('|'.join(map(re.escape, IMPL_PROP_KEYWORDS)))
+MENTION_RE = re.compile('|'.join(map(re.escape, MENTION_KEYWORDS)))
+
 # Combo/parlay event prefixes — multi-leg bets with terrible liquidity
 # Deviation is just vig structure, not real mispricing
 IMPL_EXCLUDED_PREFIXES = [
     'KXMVESPORTS', 'KXMULTIGAME', 'KXPARLAY', 'KXCOMBO',
     'KXMVESPORTSMULTIGAME',
 ]
+# Crypto/financials — prices driven by external feeds, not mispricing
+IMPL_FEED_PREFIXES = [
+    'KXBTC', 'KXETH', 'KXSOL', 'KXCRYPTO', 'KXDOGE', 'KXXRP',
+    'KXINX', 'KXNASDAQ', 'KXSP5', 'KXWTI', 'KXINXU',
+]
+# Tuples for a single C-level str.startswith() call. Kalshi tickers are always
+# uppercase, so the screens match them as-is without an .upper() copy each.
+IMPL_EXCLUDED_PREFIX_TUPLE = tuple(p.upper() for p in IMPL_EXCLUDED_PREFIXES)
+IMPL_FEED_PREFIX_TUPLE = tuple(p.upper() for p in IMPL_FEED_PREFIXES)
 
 # State files
 STATE_DIR = Path(__file__).parent
 POSITIONS_FILE = STATE_DIR / 'kalshi_positions.json'
 SIGNAL_HISTORY_FILE = STATE_DIR / 'kalshi_signal_history.json'
-TRADE_LOG_FILE = STATE_DIR / 'kalshi_trade_log.json'
+TRADE_LOG_FILE = STATE_DIR / 'kalshi_trade_log.jsonl'  # JSON Lines, append-only
+LEGACY_TRADE_LOG_FILE = STATE_DIR / 'kalshi_trade_log.json'  # Pre-JSONL array, migrated once
 IMPL_SIGNAL_HISTORY_FILE = STATE_DIR / 'kalshi_impl_signal_history.json'
+TRADE_LOG_MAX_ENTRIES = 500   # Trade log is trimmed to this many lines on startup
+CACHE_FILE = STATE_DIR / 'kalshi_cache.json'
+MARKET_CACHE_TTL = 300            # Persisted market dicts older than this are dropped on load
+CATEGORY_CACHE_TTL = 24 * 3600    # Event categories rarely change
+
+# Sign of P&L per unit YES price move: a SELL fade (holding NO) gains when
+# YES falls, a BUY fade (holding YES) when it rises
+FADE_PNL_SIGN = {'SELL': -1, 'BUY': 1}
+
+
+def _atomic_write_json(path, data):
+    """Write compact JSON to a temp file and rename it over `path`."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(data))
+    os.replace(tmp_path, path)
+
+
+@functools.lru_cache(maxsize=8192)
+def _epoch_secs(prefix):
+    """Epoch seconds for the 'YYYY-MM-DDTHH:MM:SS' head of a timestamp. Trades
+    arrive in bursts, so most heads in a page repeat and hit this cache."""
+    return calendar.timegm((
+        int(prefix[0:4]), int(prefix[5:7]), int(prefix[8:10]),
+        int(prefix[11:13]), int(prefix[14:16]), int(prefix[17:19]), 0, 0, 0,
+    ))
+
+
+def _parse_ts(s):
+    """Parse a Kalshi ISO-8601 UTC timestamp ('2024-01-31T12:34:56.789Z') into
+    integer epoch microseconds by slicing fixed offsets. Returns 0 if malformed."""
+    try:
+        secs = _epoch_secs(s[:19])
+    except (ValueError, TypeError):
+        return 0
+    micros = 0
+    if s[19:20] == '.':
+        frac = s[20:].rstrip('Z')[:6]
+        if frac.isdigit():
+            micros = int(frac.ljust(6, '0'))
+    return secs * 1_000_000 + micros
+
+
+@functools.lru_cache(maxsize=10_000)
+def _has_excluded_prefix(ticker):
+    """Prefix verdicts never change, and most tickers reappear every scan.
+    Kalshi tickers are always uppercase, so they are matched as-is."""
+    return ticker.startswith(EXCLUDED_PREFIX_TUPLE)
+
+
+@functools.lru_cache(maxsize=64)
+def _utc_minute_str(minute):
+    """'Jan 31 12:34 UTC' for an epoch minute."""
+    return time.strftime('%b %d %H:%M UTC', time.gmtime(minute * 60))
+
+
+def _exit_time_str(signal_time, hold_hours):
+    """Scheduled exit of a signal. Keyed on the exit minute, so every alert
+    whose exit falls in the same minute shares one formatted string."""
+    return _utc_minute_str(int(signal_time + hold_hours * 3600) // 60)
+
+
+@functools.lru_cache(maxsize=2)
+def _utc_day(day):
+    """'YYYY-MM-DD' for a UTC day number (epoch seconds // 86400)."""
+    return time.strftime('%Y-%m-%d', time.gmtime(day * 86400))
 
 
 # =====================================================================
@@ -151,12 +304,97 @@ IMPL_SIGNAL_HISTORY_FILE = STATE_DIR / 'kalshi_impl_signal_history.json'
 # =====================================================================
 
 class KalshiClient:
+    # RSA-PSS signing parameters are immutable; built once at import and shared
+    _SIGN_HASH = hashes.SHA256()
+    _SIGN_PADDING = padding.PSS(
+        mgf=padding.MGF1(hashes.SHA256()),
+        salt_length=padding.PSS.MAX_LENGTH,
+    )
+
     def __init__(self):
         self.market_cache = {}
         self.category_cache = {}
-        self.session = requests.Session()
-        self.private_key = None
-        self._load_private_key()
+        self.market_cache_times = {}    # ticker -> fetch timestamp
+        self.orderbook_cache = {}       # ticker -> (time.monotonic() at fetch, orderbook)
+        self.last_trade_cents = {}      # ticker -> (_ts, YES cents) of the newest trade seen in the last scan
+        self.category_cache_times = {}  # ticker -> fetch timestamp
+        self.allowed_cache = {}         # ticker -> is_allowed_ticker() verdict, once its category is known
+        self._cache_dirty = False
+        self.session = self._build_session()
+        self.pool = ThreadPoolExecutor(max_workers=HTTP_WORKERS)
+        self._load_cache()
+        atexit.register(self.save_cache)
+
+    @staticmethod
+    def _build_session():
+        """Session with a keep-alive pool sized for one host and transport retries.
+        POST is not in urllib3's default retry methods, so orders are never resent."""
+        session = requests.Session()
+        retry = Retry(
+            total=HTTP_MAX_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,  # hand the last response back to our status checks
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+        session.mount('https://', adapter)
+        return session
+
+    def _load_cache(self):
+        """Restore market/category caches from disk, skipping expired entries."""
+        try:
+            with open(CACHE_FILE, 'rb') as f:
+                data = orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return
+        now = time.time()
+        for ticker, (ts, market) in data.get('markets', {}).items():
+            if now - ts < MARKET_CACHE_TTL:
+                self.market_cache[ticker] = market
+                self.market_cache_times[ticker] = ts
+        for ticker, (ts, cat) in data.get('categories', {}).items():
+            if now - ts < CATEGORY_CACHE_TTL:
+                self.category_cache[ticker] = sys.intern(cat)
+                self.category_cache_times[ticker] = ts
+        api_log.info("  Cache loaded: %d markets, %d categories", len(self.market_cache), len(self.category_cache))
+
+    def _prune_caches(self, now):
+        """Evict expired market/category entries so the caches stay bounded
+        by what was seen within their TTLs rather than growing with uptime."""
+        for cache, times, ttl in (
+            (self.market_cache, self.market_cache_times, MARKET_CACHE_TTL),
+            (self.category_cache, self.category_cache_times, CATEGORY_CACHE_TTL),
+        ):
+            for ticker in [t for t in cache if now - times.get(t, now) >= ttl]:
+                del cache[ticker]
+                times.pop(ticker, None)
+        # A verdict lives exactly as long as the category it was derived from
+        for ticker in [t for t in self.allowed_cache if t not in self.category_cache]:
+            del self.allowed_cache[ticker]
+        # Books are only reused for seconds; drop the ones no call can hit again
+        mono = time.monotonic()
+        for ticker in [t for t, (ts, _) in self.orderbook_cache.items() if mono - ts >= ORDERBOOK_CACHE_TTL]:
+            del self.orderbook_cache[ticker]
+
+    def save_cache(self):
+        """Prune expired entries, then persist market/category caches if
+        anything changed since the last save."""
+        now = time.time()
+        self._prune_caches(now)
+        if not self._cache_dirty:
+            return
+        markets = {t: [self.market_cache_times.get(t, now), m] for t, m in self.market_cache.items()}
+        categories = {t: [self.category_cache_times.get(t, now), c] for t, c in self.category_cache.items()}
+        try:
+            _atomic_write_json(CACHE_FILE, {'markets': markets, 'categories': categories})
+            self._cache_dirty = False
+        except OSError as e:
+            api_log.warning('  Cache save error: %s', e)
+
+    @functools.cached_property
+    def private_key(self):
+        """RSA key for signing, loaded on first use (None if unavailable)."""
+        return self._load_private_key()
 
     def _load_private_key(self):
         """Load RSA private key for API authentication.
@@ -166,75 +404,83 @@ class KalshiClient:
           3. KALSHI_PRIVATE_KEY_PATH — path to PEM file (for local)
         """
         # Debug: show which env vars are set (not the values)
-        print(f"  Key env vars: KALSHI_PRIVATE_KEY={'SET' if KALSHI_PRIVATE_KEY else 'EMPTY'} "
-              f"({len(KALSHI_PRIVATE_KEY)} chars), "
-              f"B64={'SET' if KALSHI_PRIVATE_KEY_B64 else 'EMPTY'} "
-              f"({len(KALSHI_PRIVATE_KEY_B64)} chars), "
-              f"PATH={'SET' if KALSHI_PRIVATE_KEY_PATH else 'EMPTY'}, "
-              f"API_KEY_ID={'SET' if KALSHI_API_KEY_ID else 'EMPTY'}")
+        api_log.debug(
+            "  Key env vars: KALSHI_PRIVATE_KEY=%s (%d chars), B64=%s (%d chars), PATH=%s, API_KEY_ID=%s",
+            'SET' if KALSHI_PRIVATE_KEY else 'EMPTY', len(KALSHI_PRIVATE_KEY),
+            'SET' if KALSHI_PRIVATE_KEY_B64 else 'EMPTY', len(KALSHI_PRIVATE_KEY_B64),
+            'SET' if KALSHI_PRIVATE_KEY_PATH else 'EMPTY',
+            'SET' if KALSHI_API_KEY_ID else 'EMPTY',
+        )
 
         # Mode 1: raw PEM content from env var (Railway)
         if KALSHI_PRIVATE_KEY:
             try:
                 pem_data = KALSHI_PRIVATE_KEY.replace('\\n', '\n').encode()
-                self.private_key = serialization.load_pem_private_key(pem_data, password=None)
-                print("  RSA key loaded from KALSHI_PRIVATE_KEY env var")
-                return
+                key = serialization.load_pem_private_key(pem_data, password=None)
+                api_log.info("  RSA key loaded from KALSHI_PRIVATE_KEY env var")
+                return key
             except Exception as e:
-                print(f"  WARNING: Failed to load private key from KALSHI_PRIVATE_KEY: {e}")
+                api_log.warning("  WARNING: Failed to load private key from KALSHI_PRIVATE_KEY: %s", e)
 
         # Mode 2: base64-encoded PEM from env var (Railway)
         if KALSHI_PRIVATE_KEY_B64:
             try:
-                import base64
                 pem_data = base64.b64decode(KALSHI_PRIVATE_KEY_B64)
-                self.private_key = serialization.load_pem_private_key(pem_data, password=None)
-                print("  RSA key loaded from KALSHI_PRIVATE_KEY_B64 env var")
-                return
+                key = serialization.load_pem_private_key(pem_data, password=None)
+                api_log.info("  RSA key loaded from KALSHI_PRIVATE_KEY_B64 env var")
+                return key
             except Exception as e:
-                print(f"  WARNING: Failed to load private key from KALSHI_PRIVATE_KEY_B64: {e}")
+                api_log.warning("  WARNING: Failed to load private key from KALSHI_PRIVATE_KEY_B64: %s", e)
 
         # Mode 3: file path (local)
         if not KALSHI_PRIVATE_KEY_PATH:
-            print("  WARNING: No KALSHI_PRIVATE_KEY, KALSHI_PRIVATE_KEY_B64, or KALSHI_PRIVATE_KEY_PATH set — trading disabled")
-            return
+            api_log.warning("  WARNING: No KALSHI_PRIVATE_KEY, KALSHI_PRIVATE_KEY_B64, or KALSHI_PRIVATE_KEY_PATH set — trading disabled")
+            return None
         key_path = Path(KALSHI_PRIVATE_KEY_PATH).expanduser()
         if not key_path.exists():
-            print(f"  WARNING: Private key not found at {key_path} — trading disabled")
-            return
+            api_log.warning("  WARNING: Private key not found at %s — trading disabled", key_path)
+            return None
         try:
             with open(key_path, 'rb') as f:
-                self.private_key = serialization.load_pem_private_key(f.read(), password=None)
-            print(f"  RSA key loaded from {key_path}")
+                key = serialization.load_pem_private_key(f.read(), password=None)
+            api_log.info("  RSA key loaded from %s", key_path)
+            return key
         except Exception as e:
-            print(f"  WARNING: Failed to load private key: {e}")
+            api_log.warning("  WARNING: Failed to load private key: %s", e)
+            return None
 
     def _sign_request(self, method, path):
         """Generate RSA-PSS auth headers for authenticated endpoints."""
-        if not self.private_key or not KALSHI_API_KEY_ID:
+        if not KALSHI_API_KEY_ID or not self.private_key:
             return {}
         timestamp = str(int(time.time() * 1000))
         message = f"{timestamp}{method.upper()}{path}".encode()
-        signature = self.private_key.sign(
-            message,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.MAX_LENGTH,
-            ),
-            hashes.SHA256(),
-        )
+        signature = self.private_key.sign(message, self._SIGN_PADDING, self._SIGN_HASH)
         return {
             'KALSHI-ACCESS-KEY': KALSHI_API_KEY_ID,
             'KALSHI-ACCESS-SIGNATURE': base64.b64encode(signature).decode(),
             'KALSHI-ACCESS-TIMESTAMP': timestamp,
         }
 
+    @staticmethod
+    def _json(resp):
+        """Decode a response body with orjson (several times faster than stdlib
+        json on the multi-page market/trade payloads)."""
+        return orjson.loads(resp.content)
+
     @property
     def can_trade(self):
-        return self.private_key is not None and KALSHI_API_KEY_ID != ''
+        return KALSHI_API_KEY_ID != '' and self.private_key is not None
 
     # --- Public endpoints (no auth) ---
 
+    def ping(self):
+        """GET /exchange/status — cheap request that keeps a pooled connection open."""
+        try:
+            self.session.get(f'{KALSHI_BASE}/exchange/status', timeout=5)
+        except Exception:
+            pass
+
     def get_markets(self, status='open', limit=200, cursor=None):
         params = {'status': status, 'limit': limit}
         if cursor:
@@ -242,24 +488,43 @@ class KalshiClient:
         try:
             resp = self.session.get(f'{KALSHI_BASE}/markets', params=params, timeout=15)
             if resp.status_code == 200:
-                data = resp.json()
+                data = self._json(resp)
                 return data.get('markets', []), data.get('cursor', '')
         except Exception as e:
-            print(f'  API error (markets): {e}')
+            api_log.warning('  API error (markets): %s', e)
         return [], ''
 
+    def _market_fresh(self, ticker, now):
+        return ticker in self.market_cache and now - self.market_cache_times.get(ticker, 0) < MARKET_CACHE_TTL
+
+    def invalidate(self, ticker):
+        """Drop a cached market so the next get_market() refetches it."""
+        if self.market_cache.pop(ticker, None) is not None:
+            self.market_cache_times.pop(ticker, None)
+            self._cache_dirty = True
+
     def get_market(self, ticker):
-        if ticker in self.market_cache:
+        if self._market_fresh(ticker, time.time()):
             return self.market_cache[ticker]
         try:
             resp = self.session.get(f'{KALSHI_BASE}/markets/{ticker}', timeout=10)
             if resp.status_code == 200:
-                market = resp.json().get('market', {})
+                market = self._json(resp).get('market', {})
                 self.market_cache[ticker] = market
+                self.market_cache_times[ticker] = time.time()
+                self._cache_dirty = True
                 return market
         except Exception:
             pass
-        return {}
+        return self.market_cache.get(ticker, {})  # stale beats nothing if the refetch failed
+
+    def prefetch_markets(self, tickers):
+        """get_market() for every uncached ticker, fanned out over the pool so
+        the round trips overlap instead of running back to back."""
+        now = time.time()
+        pending = [t for t in set(tickers) if t and not self._market_fresh(t, now)]
+        if pending:
+            list(self.pool.map(self.get_market, pending))
 
     def get_trades(self, ticker=None, limit=1000, cursor=None, min_ts=None, max_ts=None):
         params = {'limit': limit}
@@ -274,89 +539,210 @@ class KalshiClient:
         try:
             resp = self.session.get(f'{KALSHI_BASE}/markets/trades', params=params, timeout=15)
             if resp.status_code == 200:
-                data = resp.json()
-                return data.get('trades', []), data.get('cursor', '')
+                data = self._json(resp)
+                trades = data.get('trades', [])
+                # Parse timestamps once here; everything downstream compares ints
+                for t in trades:
+                    t['_ts'] = _parse_ts(t.get('created_time', ''))
+                return trades, data.get('cursor', '')
         except Exception as e:
-            print(f'  API error (trades): {e}')
+            api_log.warning('  API error (trades): %s', e)
         return [], ''
 
     def get_all_recent_trades(self, since_minutes=65):
-        cutoff = datetime.now(timezone.utc) - timedelta(minutes=since_minutes)
-        cutoff_str = cutoff.strftime('%Y-%m-%dT%H:%M:%SZ')
+        """Fetch the trade window as TRADE_FETCH_SHARDS time slices in parallel,
+        paginating within each slice. Returns trades newest-first, deduped."""
+        now = time.time()
+        start = now - since_minutes * 60
+        step = (now - start) / TRADE_FETCH_SHARDS
+        bounds = [(start + i * step, start + (i + 1) * step) for i in range(TRADE_FETCH_SHARDS)]
+        bounds[-1] = (bounds[-1][0], now + 60)  # include trades that land while fetching
+        # Every shard gets its first page; the rest of the budget goes to
+        # whichever shards are still paging, so a burst in one slice can use it
+        extra_pages = threading.Semaphore(max(0, TRADE_MAX_PAGES - TRADE_FETCH_SHARDS))
+        shards = self.pool.map(lambda b: self._get_trades_window(b[0], b[1], extra_pages), bounds)
+
+        seen = set()
+        all_trades = []
+        for shard in shards:
+            for t in shard:
+                key = t.get('trade_id') or id(t)
+                if key not in seen:
+                    seen.add(key)
+                    all_trades.append(t)
+        # Every trade here came through get_trades(), so '_ts' is always set:
+        # a C-level itemgetter key instead of a Python call per trade
+        all_trades.sort(key=operator.itemgetter('_ts'), reverse=True)
+
+        last_trade_cents = {}
+        for t in all_trades:
+            ticker = t.get('ticker')
+            if ticker and ticker not in last_trade_cents:
+                try:
+                    last_trade_cents[ticker] = (t['_ts'], round(float(t['yes_price_dollars']) * 100))
+                except (KeyError, ValueError, TypeError):
+                    pass
+        self.last_trade_cents = last_trade_cents
+        return all_trades
+
+    def _get_trades_window(self, min_ts, max_ts, extra_pages):
+        """Cursor-paginate trades with min_ts <= created_time <= max_ts. The API
+        applies the window, so every page is used as-is and paging ends when
+        the cursor runs out. Pages after the first are drawn from the shared
+        `extra_pages` semaphore."""
         all_trades = []
         cursor = None
-        pages = 0
-        max_pages = 50
-        while pages < max_pages:
-            trades, cursor = self.get_trades(limit=TRADES_PER_PAGE, cursor=cursor)
+        while True:
+            trades, cursor = self.get_trades(
+                limit=TRADES_PER_PAGE, cursor=cursor, min_ts=min_ts, max_ts=max_ts,
+            )
             if not trades:
                 break
-            hit_cutoff = False
-            for t in trades:
-                ts = t.get('created_time', '')
-                if ts < cutoff_str:
-                    hit_cutoff = True
-                    break
-                all_trades.append(t)
-            if hit_cutoff:
-                break
-            pages += 1
+            all_trades.extend(trades)
             if not cursor:
                 break
+            if not extra_pages.acquire(blocking=False):
+                api_log.warning('  Trade page budget (%d) spent: window %s-%s truncated after %d trades',
+                                TRADE_MAX_PAGES, time.strftime('%H:%M:%S', time.gmtime(min_ts)),
+                                time.strftime('%H:%M:%S', time.gmtime(max_ts)), len(all_trades))
+                break
         return all_trades
 
+    @staticmethod
+    def _mid_price(market):
+        yes_bid = market.get('yes_bid_dollars')
+        yes_ask = market.get('yes_ask_dollars')
+        if yes_bid and yes_ask:
+            try:
+                return (float(yes_bid) + float(yes_ask)) / 2
+            except (ValueError, TypeError):
+                pass
+        last = market.get('last_price_dollars')
+        if last:
+            try:
+                return float(last)
+            except (ValueError, TypeError):
+                pass
+        return None
+
     def get_current_price(self, ticker):
         market = self.get_market(ticker)
-        if market:
-            yes_bid = market.get('yes_bid_dollars')
-            yes_ask = market.get('yes_ask_dollars')
-            if yes_bid and yes_ask:
-                try:
-                    return (float(yes_bid) + float(yes_ask)) / 2
-                except (ValueError, TypeError):
-                    pass
-            last = market.get('last_price_dollars')
-            if last:
-                try:
-                    return float(last)
-                except (ValueError, TypeError):
-                    pass
-        self.market_cache.pop(ticker, None)
-        market = self.get_market(ticker)
-        if market:
-            last = market.get('last_price_dollars')
-            if last:
-                try:
-                    return float(last)
-                except (ValueError, TypeError):
-                    pass
-        return None
+        if not market:
+            return None
+        # Cached markets are reused across cycles until refreshed (which
+        # replaces the dict), so parse the price strings once per fetch
+        if '_mid' not in market:
+            market['_mid'] = self._mid_price(market)
+        return market['_mid']
+
+    def refresh_markets(self, tickers):
+        """Refresh market_cache for many tickers via batched /markets?tickers=
+        requests instead of one GET per ticker. Tickers missing from the
+        response are evicted so the next get_market() fetches them directly."""
+        tickers = list(tickers)
+        for i in range(0, len(tickers), MARKETS_BATCH_SIZE):
+            chunk = tickers[i:i + MARKETS_BATCH_SIZE]
+            try:
+                resp = self.session.get(
+                    f'{KALSHI_BASE}/markets',
+                    params={'tickers': ','.join(chunk), 'limit': len(chunk)},
+                    timeout=15,
+                )
+                if resp.status_code != 200:
+                    api_log.warning('  Markets refresh error %s', resp.status_code)
+                    continue
+                markets = self._json(resp).get('markets', [])
+            except Exception as e:
+                api_log.warning('  API error (markets refresh): %s', e)
+                continue
+            now = time.time()
+            returned = set()
+            for m in markets:
+                t = m.get('ticker', '')
+                if t:
+                    self.market_cache[t] = m
+                    self.market_cache_times[t] = now
+                    returned.add(t)
+            for t in chunk:
+                if t not in returned:
+                    self.invalidate(t)
+            self._cache_dirty = True
+
+    def trade_hint(self, ticker):
+        """YES cents of the newest scanned trade if it is within
+        QUOTE_HINT_MAX_AGE seconds, or None. No network call."""
+        last = self.last_trade_cents.get(ticker)
+        if not last or time.time() * 1_000_000 - last[0] > QUOTE_HINT_MAX_AGE * 1_000_000:
+            return None
+        return last[1]
+
+    def quote_hint(self, ticker):
+        """(yes_bid_cents, yes_ask_cents) from a market fetched within
+        QUOTE_HINT_MAX_AGE seconds, or None. No network call."""
+        market = self.market_cache.get(ticker)
+        if not market or time.time() - self.market_cache_times.get(ticker, 0) > QUOTE_HINT_MAX_AGE:
+            return None
+        try:
+            return (round(float(market['yes_bid_dollars']) * 100),
+                    round(float(market['yes_ask_dollars']) * 100))
+        except (KeyError, ValueError, TypeError):
+            return None
 
     def is_allowed_ticker(self, ticker):
-        ticker_upper = ticker.upper()
-        for prefix in EXCLUDED_PREFIXES:
-            if ticker_upper.startswith(prefix.upper()):
-                return False
+        allowed = self.allowed_cache.get(ticker)
+        if allowed is not None:
+            return allowed
+        if _has_excluded_prefix(ticker):
+            return False
         if ticker in self.category_cache:
-            return self.category_cache[ticker] not in EXCLUDED_CATEGORIES
+            allowed = self.allowed_cache[ticker] = self.category_cache[ticker] not in EXCLUDED_CATEGORIES
+            return allowed
         market = self.get_market(ticker)
         event_ticker = market.get('event_ticker', '')
         if event_ticker:
             info = self.get_event_info(event_ticker)
             cat = info.get('category', '')
             self.category_cache[ticker] = cat
+            self.category_cache_times[ticker] = time.time()
+            self._cache_dirty = True
             if cat in EXCLUDED_CATEGORIES:
                 return False
         return True
 
+    def prefetch_categories(self, tickers):
+        """Resolve event categories for uncached tickers concurrently, so
+        is_allowed_ticker() hits the cache instead of making two serial
+        requests per new ticker. Each distinct event is fetched once."""
+        pending = [
+            t for t in tickers
+            if t and t not in self.category_cache
+            and not _has_excluded_prefix(t)
+        ]
+        if not pending:
+            return
+        self.prefetch_markets(pending)
+        event_by_ticker = {t: self.get_market(t).get('event_ticker', '') for t in pending}
+        events = list({e for e in event_by_ticker.values() if e})
+        infos = dict(zip(events, self.pool.map(self.get_event_info, events)))
+        now = time.time()
+        for ticker, event_ticker in event_by_ticker.items():
+            if event_ticker:
+                self.category_cache[ticker] = infos[event_ticker].get('category', '')
+                self.category_cache_times[ticker] = now
+                self._cache_dirty = True
+        # Save now rather than at the end of the cycle: on a cold start this is
+        # thousands of lookups that a crash mid-cycle would otherwise lose
+        self.save_cache()
+
     def get_event_info(self, event_ticker):
         try:
             resp = self.session.get(f'{KALSHI_BASE}/events/{event_ticker}', timeout=10)
             if resp.status_code == 200:
-                event = resp.json().get('event', {})
+                event = self._json(resp).get('event', {})
                 return {
                     'title': event.get('title', ''),
-                    'category': event.get('category', ''),
+                    # Interned: a handful of distinct values shared by every cached ticker
+                    'category': sys.intern(event.get('category', '')),
                 }
         except Exception:
             pass
@@ -367,18 +753,17 @@ class KalshiClient:
         all_markets = []
         cursor = None
         pages = 0
-        while pages < 200:
+        while pages < MARKETS_MAX_OPEN // MARKETS_PAGE_LIMIT:
             try:
-                params = {'status': 'open', 'limit': 200}
+                params = {'status': 'open', 'limit': MARKETS_PAGE_LIMIT}
                 if cursor:
                     params['cursor'] = cursor
+                # 429s are retried by the session's Retry (honouring Retry-After)
                 resp = self.session.get(f'{KALSHI_BASE}/markets', params=params, timeout=15)
-                if resp.status_code == 429:
-                    time.sleep(3)
-                    continue
                 if resp.status_code != 200:
+                    api_log.warning('  Markets page error %s', resp.status_code)
                     break
-                data = resp.json()
+                data = self._json(resp)
                 markets = data.get('markets', [])
                 cursor = data.get('cursor', '')
                 all_markets.extend(markets)
@@ -386,7 +771,7 @@ class KalshiClient:
                 if not markets or not cursor:
                     break
             except Exception as e:
-                print(f'  API error (all markets): {e}')
+                api_log.warning('  API error (all markets): %s', e)
                 break
         return all_markets
 
@@ -401,12 +786,12 @@ class KalshiClient:
         try:
             resp = self.session.get(f'{KALSHI_BASE}/portfolio/balance', headers=headers, timeout=10)
             if resp.status_code == 200:
-                data = resp.json()
+                data = self._json(resp)
                 return data.get('balance', 0)  # cents
             else:
-                print(f'  Balance error {resp.status_code}: {resp.text[:200]}')
+                api_log.warning('  Balance error %s: %.200s', resp.status_code, resp.text)
         except Exception as e:
-            print(f'  Balance error: {e}')
+            api_log.warning('  Balance error: %s', e)
         return None
 
     def get_positions(self):
@@ -418,24 +803,35 @@ class KalshiClient:
         try:
             resp = self.session.get(f'{KALSHI_BASE}/portfolio/positions', headers=headers, timeout=10)
             if resp.status_code == 200:
-                data = resp.json()
+                data = self._json(resp)
                 return data.get('market_positions', [])
             else:
-                print(f'  Positions error {resp.status_code}: {resp.text[:200]}')
+                api_log.warning('  Positions error %s: %.200s', resp.status_code, resp.text)
         except Exception as e:
-            print(f'  Positions error: {e}')
+            api_log.warning('  Positions error: %s', e)
         return []
 
     def get_orderbook(self, ticker):
-        """GET /markets/{ticker}/orderbook — returns yes/no bids and asks."""
+        """GET /markets/{ticker}/orderbook — returns yes/no bids and asks.
+        A book fetched within ORDERBOOK_CACHE_TTL seconds is reused."""
+        cached = self.orderbook_cache.get(ticker)
+        if cached and time.monotonic() - cached[0] < ORDERBOOK_CACHE_TTL:
+            return cached[1]
         try:
             resp = self.session.get(f'{KALSHI_BASE}/markets/{ticker}/orderbook', timeout=10)
             if resp.status_code == 200:
-                return resp.json().get('orderbook', {})
+                orderbook = self._json(resp).get('orderbook', {})
+                self.orderbook_cache[ticker] = (time.monotonic(), orderbook)
+                return orderbook
         except Exception as e:
-            print(f'  Orderbook error ({ticker}): {e}')
+            api_log.warning('  Orderbook error (%s): %s', ticker, e)
         return {}
 
+    def get_orderbooks(self, tickers):
+        """Fetch several orderbooks concurrently. Returns {ticker: orderbook}."""
+        tickers = list(tickers)
+        return dict(zip(tickers, self.pool.map(self.get_orderbook, tickers)))
+
     def create_order(self, ticker, side, action, count, price_cents):
         """
         POST /portfolio/orders
@@ -465,29 +861,66 @@ class KalshiClient:
                 headers=headers, json=body, timeout=15,
             )
             if resp.status_code in (200, 201):
-                data = resp.json()
+                data = self._json(resp)
                 return data.get('order', data)
             else:
-                print(f'  Order error {resp.status_code}: {resp.text[:300]}')
+                api_log.warning('  Order error %s: %.300s', resp.status_code, resp.text)
         except Exception as e:
-            print(f'  Order error: {e}')
+            api_log.warning('  Order error: %s', e)
         return None
 
     def cancel_order(self, order_id):
         """DELETE /portfolio/orders/{order_id}"""
+        return self.cancel_and_fetch(order_id) is not None
+
+    def cancel_and_fetch(self, order_id):
+        """DELETE /portfolio/orders/{order_id}, returning the order as of the
+        cancel ({} if the response has no body), or None if it failed."""
         path = f'/trade-api/v2/portfolio/orders/{order_id}'
         headers = self._sign_request('DELETE', path)
         if not headers:
-            return False
+            return None
         try:
             resp = self.session.delete(
                 f'{KALSHI_BASE}/portfolio/orders/{order_id}',
                 headers=headers, timeout=10,
             )
-            return resp.status_code in (200, 204)
+            if resp.status_code == 200:
+                return self._json(resp).get('order') or {}
+            if resp.status_code == 204:
+                return {}
+        except Exception as e:
+            api_log.warning('  Cancel error: %s', e)
+        return None
+
+    def batch_cancel_orders(self, order_ids):
+        """
+        DELETE /portfolio/orders/batched — cancel several orders in one request.
+        Falls back to per-order cancels if the batch call is rejected.
+        Returns {order_id: canceled_bool}.
+        """
+        if not order_ids:
+            return {}
+        path = '/trade-api/v2/portfolio/orders/batched'
+        headers = self._sign_request('DELETE', path)
+        if not headers:
+            return {oid: False for oid in order_ids}
+        headers['Content-Type'] = 'application/json'
+        try:
+            resp = self.session.delete(
+                f'{KALSHI_BASE}/portfolio/orders/batched',
+                headers=headers, json={'ids': list(order_ids)}, timeout=10,
+            )
+            if resp.status_code == 200:
+                results = {oid: False for oid in order_ids}
+                for o in self._json(resp).get('orders', []):
+                    if o.get('order_id') in results:
+                        results[o['order_id']] = not o.get('error')
+                return results
+            api_log.warning('  Batch cancel error %s: %.200s', resp.status_code, resp.text)
         except Exception as e:
-            print(f'  Cancel error: {e}')
-        return False
+            api_log.warning('  Batch cancel error: %s', e)
+        return {oid: self.cancel_order(oid) for oid in order_ids}
 
     def get_order(self, order_id):
         """GET /portfolio/orders/{order_id}"""
@@ -501,12 +934,62 @@ class KalshiClient:
                 headers=headers, timeout=10,
             )
             if resp.status_code == 200:
-                return resp.json().get('order', {})
+                return self._json(resp).get('order', {})
         except Exception as e:
-            print(f'  Get order error: {e}')
+            api_log.warning('  Get order error: %s', e)
         return None
 
 
+# =====================================================================
+# SIGNAL
+# =====================================================================
+
+@dataclass(slots=True)
+class Signal:
+    """A detected trade signal, handed from a detector to the executor,
+    the notifier and the position tracker."""
+    ticker: str
+    title: str
+    event_ticker: str
+    fade_action: str
+    fade_side: str
+    entry_price: float
+    pre_signal_price: float
+    price_move: float
+    n_small_trades: int
+    retail_contracts: int
+    signal_time: float
+    signal_type: str = 'reversion'
+    # Reversion only
+    dominant_side: str = ''
+    n_total_trades: int = 0
+    # Implied prob only
+    prob_sum: float = 0.0
+    deviation: float = 0.0
+    abs_dev: float = 0.0
+    n_outcomes: int = 0
+
+    def log_fields(self):
+        """Every field but the title, for trade log records. The fields are all
+        scalars, so this skips asdict()'s recursive deep copy."""
+        return {name: getattr(self, name) for name in _SIGNAL_LOG_FIELDS}
+
+
+_SIGNAL_LOG_FIELDS = tuple(f.name for f in fields(Signal) if f.name != 'title')
+
+
+@dataclass(slots=True)
+class OrderInfo:
+    """Result of a filled (or dry-run) entry order, handed from the executor
+    to the position tracker and the notifier."""
+    order_id: str
+    fill_price: float
+    fill_count: int
+    bet_dollars: float
+    dry_run: bool
+    slippage_pct: float = 0.0
+
+
 # =====================================================================
 # SIGNAL DETECTOR
 # =====================================================================
@@ -514,47 +997,71 @@ class KalshiClient:
 class KalshiReversionDetector:
     def __init__(self):
         self.signal_history = {}
+        self._dirty = False
         self._load()
 
     def _load(self):
         try:
-            with open(SIGNAL_HISTORY_FILE, 'r') as f:
-                self.signal_history = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            pass
+            with open(SIGNAL_HISTORY_FILE, 'rb') as f:
+                history = orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return
+        # Only live cooldowns matter; the rest would sit in memory until the next save
+        cutoff = time.time() - COOLDOWN_HOURS * 3600
+        self.signal_history = {k: ts for k, ts in history.items() if ts > cutoff}
 
-    def _save(self):
-        with open(SIGNAL_HISTORY_FILE, 'w') as f:
-            json.dump(self.signal_history, f)
+    def _save(self, now_ts):
+        """Drop expired cooldowns and write the history once."""
+        cutoff = now_ts - COOLDOWN_HOURS * 3600
+        self.signal_history = {t: ts for t, ts in self.signal_history.items() if ts > cutoff}
+        _atomic_write_json(SIGNAL_HISTORY_FILE, self.signal_history)
+        self._dirty = False
 
     def detect(self, trades, client, now_ts):
+        """`trades` must be newest-first, as returned by get_all_recent_trades()."""
         if not trades:
             return []
 
-        by_ticker = {}
+        # The per-trade loop only groups. Filtering and tallies run per ticker,
+        # and only for tickers with enough trades to qualify (most tickers in a
+        # scan have just a handful). Grouping keeps the input's newest-first
+        # order, so every ticker's list is already time-sorted.
+        by_ticker = collections.defaultdict(list)
         for t in trades:
-            ticker = t.get('ticker', '')
-            if not ticker:
-                continue
-            if ticker not in by_ticker:
-                by_ticker[ticker] = []
-            by_ticker[ticker].append(t)
+            ticker = t.get('ticker')
+            if ticker:
+                by_ticker[ticker].append(t)
 
-        signals = []
+        candidates = []
+        cooldown_cutoff = now_ts - COOLDOWN_HOURS * 3600
 
         for ticker, ticker_trades in by_ticker.items():
-            if not client.is_allowed_ticker(ticker):
+            if len(ticker_trades) < MIN_SMALL_TRADES:
+                continue
+            # Cheapest rejection first: tickers still in cooldown skip all the scans below
+            if self.signal_history.get(ticker, 0) > cooldown_cutoff:
                 continue
 
-            small_trades = [t for t in ticker_trades if t.get('count', 0) <= SMALL_TRADE_LIMIT]
-            if len(small_trades) < MIN_SMALL_TRADES:
+            # Stop scanning once past MAX_SMALL_TRADES: busy tickers carry
+            # thousands of trades but are rejected as soon as the cap is exceeded
+            small_trades = []
+            yes_count = 0
+            for t in ticker_trades:
+                if t.get('count', 0) <= SMALL_TRADE_LIMIT:
+                    small_trades.append(t)
+                    yes_count += t.get('taker_side') == 'yes'
+                    if len(small_trades) > MAX_SMALL_TRADES:
+                        break
+            total = len(small_trades)
+            if total < MIN_SMALL_TRADES:
                 continue
-            if len(small_trades) > MAX_SMALL_TRADES:
+            if total > MAX_SMALL_TRADES:
                 continue
 
-            yes_count = sum(1 for t in small_trades if t.get('taker_side') == 'yes')
-            no_count = len(small_trades) - yes_count
-            total = len(small_trades)
+            if not client.is_allowed_ticker(ticker):
+                continue
+
+            no_count = total - yes_count
 
             if yes_count / total >= MIN_SIDE_RATIO:
                 dominant_side = 'yes'
@@ -566,19 +1073,13 @@ class KalshiReversionDetector:
             if SELL_ONLY and dominant_side != 'yes':
                 continue
 
-            sorted_trades = sorted(ticker_trades, key=lambda t: t.get('created_time', ''))
-            n5 = max(3, len(sorted_trades) // 5)
+            # Only the earliest and latest fifth matter; the list is newest-first
+            n5 = max(3, len(ticker_trades) // 5)
+            head = ticker_trades[-n5:]
+            tail = ticker_trades[:n5]
 
-            prices_start = []
-            prices_end = []
-            for t in sorted_trades[:n5]:
-                p = t.get('yes_price_dollars')
-                if p:
-                    prices_start.append(float(p))
-            for t in sorted_trades[-n5:]:
-                p = t.get('yes_price_dollars')
-                if p:
-                    prices_end.append(float(p))
+            prices_start = [float(p) for t in head if (p := t.get('yes_price_dollars'))]
+            prices_end = [float(p) for t in tail if (p := t.get('yes_price_dollars'))]
 
             if not prices_start or not prices_end:
                 continue
@@ -592,13 +1093,17 @@ class KalshiReversionDetector:
             if dominant_side == 'no' and move > -MIN_PRICE_MOVE:
                 continue
 
-            if p_end < ENTRY_PRICE_MIN or p_end > ENTRY_PRICE_MAX:
+            if not ENTRY_PRICE_MIN <= p_end <= ENTRY_PRICE_MAX:
                 continue
 
-            last = self.signal_history.get(ticker, 0)
-            if now_ts - last < COOLDOWN_HOURS * 3600:
-                continue
+            candidates.append((ticker, ticker_trades, small_trades, dominant_side, p_start, p_end, move))
 
+        # Market lookups for every qualifying ticker in one parallel batch
+        client.prefetch_markets(c[0] for c in candidates)
+
+        signals = []
+
+        for ticker, ticker_trades, small_trades, dominant_side, p_start, p_end, move in candidates:
             market = client.get_market(ticker)
             title = market.get('title', ticker)
             event_ticker = market.get('event_ticker', '')
@@ -612,24 +1117,27 @@ class KalshiReversionDetector:
 
             retail_volume = sum(t.get('count', 0) for t in small_trades)
 
-            self.signal_history[ticker] = now_ts
-            self._save()
+            self.signal_history[ticker] = int(now_ts)
+            self._dirty = True
 
-            signals.append({
-                'ticker': ticker,
-                'title': title,
-                'event_ticker': event_ticker,
-                'dominant_side': dominant_side,
-                'fade_action': fade_action,
-                'fade_side': fade_side,
-                'entry_price': round(p_end, 4),
-                'pre_signal_price': round(p_start, 4),
-                'price_move': round(move, 4),
-                'n_small_trades': len(small_trades),
-                'n_total_trades': len(ticker_trades),
-                'retail_contracts': retail_volume,
-                'signal_time': now_ts,
-            })
+            signals.append(Signal(
+                ticker=ticker,
+                title=title,
+                event_ticker=event_ticker,
+                dominant_side=dominant_side,
+                fade_action=fade_action,
+                fade_side=fade_side,
+                entry_price=round(p_end, 4),
+                pre_signal_price=round(p_start, 4),
+                price_move=round(move, 4),
+                n_small_trades=len(small_trades),
+                n_total_trades=len(ticker_trades),
+                retail_contracts=retail_volume,
+                signal_time=now_ts,
+            ))
+
+        if self._dirty:
+            self._save(now_ts)
 
         return signals
 
@@ -644,157 +1152,183 @@ class ImpliedProbDetector:
 
     def __init__(self):
         self.signal_history = {}  # event_ticker -> last signal timestamp
+        self._dirty = False
         self._load()
 
     def _load(self):
         try:
-            with open(IMPL_SIGNAL_HISTORY_FILE, 'r') as f:
-                self.signal_history = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            pass
+            with open(IMPL_SIGNAL_HISTORY_FILE, 'rb') as f:
+                history = orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return
+        # Only live cooldowns matter; the rest would sit in memory until the next save
+        cutoff = time.time() - IMPL_COOLDOWN_HOURS * 3600
+        self.signal_history = {k: ts for k, ts in history.items() if ts > cutoff}
+
+    def _save(self, now_ts):
+        """Drop expired cooldowns and write the history once."""
+        cutoff = now_ts - IMPL_COOLDOWN_HOURS * 3600
+        self.signal_history = {e: ts for e, ts in self.signal_history.items() if ts > cutoff}
+        _atomic_write_json(IMPL_SIGNAL_HISTORY_FILE, self.signal_history)
+        self._dirty = False
+
+    @staticmethod
+    def _market_price(m):
+        """Mid-price (bid+ask)/2 from a market payload, or last_price as fallback."""
+        yes_bid = m.get('yes_bid')
+        yes_ask = m.get('yes_ask')
+        if yes_bid and yes_ask:
+            try:
+                return (int(yes_bid) + int(yes_ask)) / 200
+            except (ValueError, TypeError):
+                pass
+        last = m.get('last_price')
+        if last:
+            try:
+                return int(last) / 100
+            except (ValueError, TypeError):
+                pass
+        return None
 
-    def _save(self):
-        with open(IMPL_SIGNAL_HISTORY_FILE, 'w') as f:
-            json.dump(self.signal_history, f)
+    @staticmethod
+    def _book_price(orderbook):
+        """Mid-price from top of book, or None if either side is empty.
+        Kalshi books only carry bids: YES ask = 100 - best NO bid."""
+        if not orderbook:
+            return None
+        yes_bids = orderbook.get('yes') or []
+        no_bids = orderbook.get('no') or []
+        if isinstance(yes_bids, dict):
+            yes_bids = yes_bids.get('bids', [])
+        if isinstance(no_bids, dict):
+            no_bids = no_bids.get('bids', [])
+        if not yes_bids or not no_bids:
+            return None
+        return (max(yes_bids)[0] + 100 - max(no_bids)[0]) / 200
+
+    @staticmethod
+    def _outcome_prices(mkts, price_of):
+        """(price, market) for each outcome priced within the tradeable range.
+        Only the winning outcome's fields are read later, so no per-outcome dicts."""
+        return [
+            (price, m) for m in mkts
+            if (price := price_of(m)) is not None and IMPL_MIN_PRICE <= price <= IMPL_MAX_PRICE
+        ]
+
+    @staticmethod
+    def _deviation(outcome_prices):
+        """prob_sum - 1.0 if it is a tradeable violation, else None."""
+        if len(outcome_prices) < IMPL_MIN_OUTCOMES:
+            return None
+        deviation = sum(price for price, _ in outcome_prices) - 1.0
+        # Too large a deviation is likely independent outcomes, not mispricing
+        if not IMPL_DEVIATION_THRESHOLD <= abs(deviation) <= IMPL_MAX_DEVIATION:
+            return None
+        return deviation
 
     def detect(self, all_markets, client, now_ts):
         """Scan all open markets for implied probability violations.
         Returns list of signals."""
-        from collections import defaultdict
-
         # Group markets by event_ticker
-        events = defaultdict(list)
+        events = collections.defaultdict(list)
         for m in all_markets:
-            et = m.get('event_ticker', '')
-            ticker = m.get('ticker', '')
-            if et and ticker:
+            et = m.get('event_ticker')
+            if et and m.get('ticker'):
                 events[et].append(m)
 
-        signals = []
+        candidates = []  # (event_ticker, mkts) that look mispriced from the market list
+        cooldown_cutoff = now_ts - IMPL_COOLDOWN_HOURS * 3600
 
         for event_ticker, mkts in events.items():
             if not (IMPL_MIN_OUTCOMES <= len(mkts) <= IMPL_MAX_OUTCOMES):
                 continue
 
-            # Skip events with independent props (spread, total, 1H, over/under)
-            # These are NOT mutually exclusive — Kalshi groups them under one event
-            # but "Kansas wins by 3.5" and "Over 145.5 total" are independent bets.
-            # Allow legit multi-outcome events like "Who wins ice skating?" (5 people)
-            prop_keywords = [
-                'over ', 'under ', 'by over', 'by under', 'spread',
-                'total', 'points', '1h ', '1st half', '2nd half',
-                'first half', 'second half', 'quarter', 'inning',
-                'half time', 'halftime',
-            ]
-            titles_lower = [m.get('title', '').lower() for m in mkts]
-            has_props = any(kw in t for t in titles_lower for kw in prop_keywords)
-            if has_props:
-                continue
+            # Screens run cheapest-first: dict lookup, then two prefix checks,
+            # and the title scans (which touch every outcome) only if those pass.
 
-            # Skip mention/independent-outcome markets (not mutually exclusive)
-            sample_title = mkts[0].get('title', '').lower()
-            is_mention = any(kw in sample_title for kw in MENTION_KEYWORDS)
-            if is_mention:
+            # Check cooldown
+            if self.signal_history.get(event_ticker, 0) > cooldown_cutoff:
                 continue
 
             # Skip combo/parlay markets (vig structure, not real mispricing)
-            event_upper = event_ticker.upper()
-            is_combo = any(event_upper.startswith(p.upper()) for p in IMPL_EXCLUDED_PREFIXES)
-            if is_combo:
+            if event_ticker.startswith(IMPL_EXCLUDED_PREFIX_TUPLE):
                 continue
 
             # Skip crypto/financials (prices driven by external feeds, not mispricing)
-            sample_ticker = mkts[0].get('ticker', '').upper()
-            is_crypto_fin = False
-            for prefix in ['KXBTC', 'KXETH', 'KXSOL', 'KXCRYPTO', 'KXDOGE', 'KXXRP',
-                           'KXINX', 'KXNASDAQ', 'KXSP5', 'KXWTI', 'KXINXU']:
-                if sample_ticker.startswith(prefix):
-                    is_crypto_fin = True
-                    break
-            if is_crypto_fin:
+            if mkts[0].get('ticker', '').startswith(IMPL_FEED_PREFIX_TUPLE):
                 continue
 
-            # Check cooldown
-            last_cd = self.signal_history.get(event_ticker, 0)
-            if now_ts - last_cd < IMPL_COOLDOWN_HOURS * 3600:
+            # Skip mention/independent-outcome markets (not mutually exclusive)
+            if MENTION_RE.search(mkts[0].get('title', '').lower()):
                 continue
 
-            # Get YES price for each outcome
-            outcome_prices = []
-            for m in mkts:
-                # Use mid-price (bid+ask)/2 or last_price as fallback
-                price = None
-                yes_bid = m.get('yes_bid')
-                yes_ask = m.get('yes_ask')
-                if yes_bid and yes_ask:
-                    try:
-                        price = (int(yes_bid) + int(yes_ask)) / 2 / 100
-                    except (ValueError, TypeError):
-                        pass
-                if price is None:
-                    last = m.get('last_price')
-                    if last:
-                        try:
-                            price = int(last) / 100
-                        except (ValueError, TypeError):
-                            pass
-                if price is not None and IMPL_MIN_PRICE <= price <= IMPL_MAX_PRICE:
-                    outcome_prices.append({
-                        'ticker': m['ticker'],
-                        'price': price,
-                        'title': m.get('title', m['ticker']),
-                        'event_ticker': event_ticker,
-                    })
-
-            if len(outcome_prices) < IMPL_MIN_OUTCOMES:
+            # Skip events with independent props (spread, total, 1H, over/under).
+            # Allow legit multi-outcome events like "Who wins ice skating?" (5 people).
+            # Titles are newline-joined so no keyword can match across two of them.
+            if IMPL_PROP_RE.search('\n'.join([m.get('title', '') for m in mkts]).lower()):
                 continue
 
-            # Compute probability sum
-            prob_sum = sum(o['price'] for o in outcome_prices)
-            deviation = prob_sum - 1.0
-            abs_dev = abs(deviation)
+            # Get YES price for each outcome
+            outcome_prices = self._outcome_prices(mkts, self._market_price)
+            if self._deviation(outcome_prices) is not None:
+                candidates.append((event_ticker, mkts))
+
+        # The paginated market list can be minutes old. Re-price only the
+        # events that look mispriced from it, using live top-of-book for all
+        # their outcomes fetched in one parallel batch.
+        books = client.get_orderbooks({m['ticker'] for _, mkts in candidates for m in mkts})
 
-            if abs_dev < IMPL_DEVIATION_THRESHOLD:
-                continue
+        def live_price(m):
+            price = self._book_price(books.get(m['ticker']))
+            return price if price is not None else self._market_price(m)
 
-            # Skip if deviation too large — likely independent outcomes, not mispricing
-            if abs_dev > IMPL_MAX_DEVIATION:
+        signals = []
+        for event_ticker, mkts in candidates:
+            outcome_prices = self._outcome_prices(mkts, live_price)
+            deviation = self._deviation(outcome_prices)
+            if deviation is None:
                 continue
+            prob_sum = deviation + 1.0
+            deviation_r = round(deviation, 4)
 
             # Determine trade direction and target
             if deviation > 0:
                 # Overpriced: sell the highest-priced outcome (buy NO)
-                target = max(outcome_prices, key=lambda o: o['price'])
+                price, target = max(outcome_prices, key=operator.itemgetter(0))
                 fade_action = 'SELL'
                 fade_side = 'no'
             else:
                 # Underpriced: buy the lowest-priced outcome (buy YES)
-                target = min(outcome_prices, key=lambda o: o['price'])
+                price, target = min(outcome_prices, key=operator.itemgetter(0))
                 fade_action = 'BUY'
                 fade_side = 'yes'
 
             # Record cooldown
-            self.signal_history[event_ticker] = now_ts
-            self._save()
-
-            signals.append({
-                'ticker': target['ticker'],
-                'title': target['title'],
-                'event_ticker': event_ticker,
-                'fade_action': fade_action,
-                'fade_side': fade_side,
-                'entry_price': round(target['price'], 4),
-                'pre_signal_price': round(target['price'], 4),  # same for impl prob
-                'price_move': round(deviation, 4),
-                'n_small_trades': len(outcome_prices),  # repurpose: n_outcomes
-                'retail_contracts': 0,
-                'signal_time': now_ts,
-                'signal_type': 'implied_prob',
-                'prob_sum': round(prob_sum, 4),
-                'deviation': round(deviation, 4),
-                'abs_dev': round(abs_dev, 4),
-                'n_outcomes': len(outcome_prices),
-            })
+            self.signal_history[event_ticker] = int(now_ts)
+            self._dirty = True
+
+            price_r = round(price, 4)
+            signals.append(Signal(
+                ticker=target['ticker'],
+                title=target.get('title', target['ticker']),
+                event_ticker=event_ticker,
+                fade_action=fade_action,
+                fade_side=fade_side,
+                entry_price=price_r,
+                pre_signal_price=price_r,  # same for impl prob
+                price_move=deviation_r,
+                n_small_trades=len(outcome_prices),  # repurpose: n_outcomes
+                retail_contracts=0,
+                signal_time=now_ts,
+                signal_type='implied_prob',
+                prob_sum=round(prob_sum, 4),
+                deviation=deviation_r,
+                abs_dev=abs(deviation_r),
+                n_outcomes=len(outcome_prices),
+            ))
+
+        if self._dirty:
+            self._save(now_ts)
 
         return signals
 
@@ -804,47 +1338,129 @@ class ImpliedProbDetector:
 # =====================================================================
 
 class TradeLogger:
+    """Append-only JSON Lines trade log.
+
+    record() updates the in-memory log and hands the entry to a background
+    writer thread, so order paths never wait on disk. The file is trimmed to
+    the last TRADE_LOG_MAX_ENTRIES lines once, on startup, and the in-memory
+    log keeps only that many entries.
+    """
+
     def __init__(self):
-        self.log = []
+        self.log = collections.deque(maxlen=TRADE_LOG_MAX_ENTRIES)
+        self.pnl_by_day = {}  # 'YYYY-MM-DD' (UTC) -> realized P&L dollars
         self._load()
+        self._fh = open(TRADE_LOG_FILE, 'ab')
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._drain, name='trade-log-writer', daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _drain(self):
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                break
+            # Keep draining on failure: a dead writer would silently drop every later entry
+            try:
+                self._fh.write(orjson.dumps(entry) + b'\n')
+                if self._queue.empty():
+                    self._fh.flush()
+            except Exception as e:
+                log.error('  Trade log write failed (%s): %s', entry.get('type'), e)
+
+    def close(self):
+        """Write out queued entries and fsync. Registered with atexit."""
+        if self._fh.closed:
+            return
+        self._queue.put(None)
+        self._writer.join(timeout=5)
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._fh.close()
 
     def _load(self):
         try:
-            with open(TRADE_LOG_FILE, 'r') as f:
-                self.log = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.log = []
-
-    def _save(self):
-        with open(TRADE_LOG_FILE, 'w') as f:
-            json.dump(self.log[-500:], f, indent=2)
+            with open(TRADE_LOG_FILE, 'rb') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            self._migrate_legacy()
+            return
+        for line in lines[-TRADE_LOG_MAX_ENTRIES:]:
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            self.log.append(entry)
+            self._add_pnl(entry)
+        if len(lines) > TRADE_LOG_MAX_ENTRIES:
+            self._rotate()
+
+    def _migrate_legacy(self):
+        """Convert the old kalshi_trade_log.json array to JSON Lines, so
+        today's realized P&L and the trade history survive the upgrade."""
+        try:
+            with open(LEGACY_TRADE_LOG_FILE, 'rb') as f:
+                entries = orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return
+        if not isinstance(entries, list):
+            return
+        for entry in entries[-TRADE_LOG_MAX_ENTRIES:]:
+            if isinstance(entry, dict):
+                self.log.append(entry)
+                self._add_pnl(entry)
+        self._rotate()
+        log.info('Migrated %d trade log entries from %s', len(self.log), LEGACY_TRADE_LOG_FILE.name)
+
+    def _rotate(self):
+        """Rewrite the file with only the entries kept in memory."""
+        tmp_path = TRADE_LOG_FILE.with_name(TRADE_LOG_FILE.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            for e in self.log:
+                f.write(orjson.dumps(e) + b'\n')
+        os.replace(tmp_path, TRADE_LOG_FILE)
+
+    def _add_pnl(self, entry):
+        if 'actual_pnl_dollars' in entry:
+            day = entry.get('logged_at', '')[:10]
+            self.pnl_by_day[day] = self.pnl_by_day.get(day, 0) + entry['actual_pnl_dollars']
 
     def record(self, entry):
         entry['logged_at'] = datetime.now(timezone.utc).isoformat()
         self.log.append(entry)
-        self._save()
+        self._add_pnl(entry)
+        self._queue.put_nowait(entry)
 
     def daily_pnl(self):
         """Sum realized P&L for today (UTC)."""
-        today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-        total = 0
-        for e in self.log:
-            if e.get('logged_at', '').startswith(today) and 'actual_pnl_dollars' in e:
-                total += e['actual_pnl_dollars']
-        return total
+        return self.pnl_by_day.get(_utc_day(int(time.time()) // 86400), 0)
 
 
 # =====================================================================
 # DYNAMIC BET SIZER
 # =====================================================================
 
-def calculate_bet_size(orderbook, side, entry_price_cents):
+def _implied_asks(bids):
+    """(best_ask_cents, depth_dollars) over the DEPTH_LEVELS cheapest asks
+    implied by the other side's bids (a bid at P is an ask at 100 - P), or
+    None for an empty side. Works on the bid levels directly, so no
+    converted [price, qty] list is built per level."""
+    best_bids = heapq.nlargest(DEPTH_LEVELS, bids, key=operator.itemgetter(0))
+    if not best_bids:
+        return None
+    # Depth in dollars: accumulate in integer cents, convert once
+    return 100 - best_bids[0][0], sum((100 - b[0]) * b[1] for b in best_bids) / 100
+
+
+def calculate_bet_size(orderbook, side, entry_price_cents, max_bet=MAX_BET_DOLLARS):
     """
     Calculate bet size from orderbook depth.
     We're buying NO side (since SELL-only = fading YES buyers).
 
     Kalshi orderbook only returns BIDS (not asks).
     To buy NO, we look at YES bids: a YES bid at price P = NO ask at (100-P).
+    Bets are capped at `max_bet` dollars.
     Returns (contracts, price_cents, uncapped_dollars) or (0, 0, 0) if too thin.
     """
     # YES bids represent the prices where someone will sell NO to us.
@@ -855,31 +1471,20 @@ def calculate_bet_size(orderbook, side, entry_price_cents):
     if not yes_bids:
         return 0, 0, 0
 
-    # Convert YES bids to NO ask prices: [no_price, quantity]
-    no_asks = [[100 - b[0], b[1]] for b in yes_bids]
-
-    # Sort asks by price ascending (best/cheapest first)
-    asks_sorted = sorted(no_asks, key=lambda x: x[0])
-
-    # Take top 3 levels
-    top_levels = asks_sorted[:3]
-    if not top_levels:
+    # The highest YES bids are the cheapest NO asks
+    asks = _implied_asks(yes_bids)
+    if not asks:
         return 0, 0, 0
-
-    total_contracts = sum(level[1] for level in top_levels)
-    best_ask_cents = top_levels[0][0]
-
-    # Each contract costs best_ask_cents cents, so depth in dollars:
-    depth_dollars = sum(level[0] * level[1] / 100 for level in top_levels)
+    best_ask_cents, depth_dollars = asks
 
     # Our bet = DEPTH_FRACTION of depth, capped
     uncapped_dollars = round(depth_dollars * DEPTH_FRACTION, 2)
-    bet_dollars = min(uncapped_dollars, MAX_BET_DOLLARS)
+    bet_dollars = min(uncapped_dollars, max_bet)
     if bet_dollars < MIN_BET_DOLLARS:
         return 0, 0, uncapped_dollars
 
-    # Convert to contracts at the best ask price
-    contracts = int(bet_dollars / (best_ask_cents / 100))
+    # Convert to contracts at the best ask price (integer cents: exact)
+    contracts = round(bet_dollars * 100) // best_ask_cents
     if contracts < 1:
         return 0, 0, uncapped_dollars
 
@@ -894,60 +1499,109 @@ class KalshiPositionTracker:
     def __init__(self):
         self.positions = []
         self.closed = []
+        self.reserved = {}  # event_ticker -> dollars held by in-flight entry orders
+        self.exposure_by_event = {}  # event_ticker -> bet dollars of open positions
+        self.count_by_type = {}  # signal_type -> tracked positions
+        self.n_live = 0  # tracked positions backed by a real order
+        self._dirty = False
         self._load()
+        self._reindex()
+        atexit.register(self.flush)
 
     def _load(self):
         try:
-            with open(POSITIONS_FILE, 'r') as f:
-                data = json.load(f)
+            with open(POSITIONS_FILE, 'rb') as f:
+                data = orjson.loads(f.read())
                 self.positions = data.get('open', [])
                 self.closed = data.get('closed', [])
-        except (FileNotFoundError, json.JSONDecodeError):
+        except (FileNotFoundError, orjson.JSONDecodeError):
             pass
 
+    def _reindex(self):
+        """Rebuild the per-event and per-strategy indexes from self.positions."""
+        self.exposure_by_event = {}
+        self.count_by_type = {}
+        self.n_live = 0
+        for pos in self.positions:
+            self._index(pos)
+
+    def _index(self, pos):
+        ev = pos.get('event_ticker')
+        if ev and pos.get('status') == 'open':
+            self.exposure_by_event[ev] = self.exposure_by_event.get(ev, 0) + pos.get('bet_dollars', 0)
+        signal_type = pos.get('signal_type', 'reversion')
+        self.count_by_type[signal_type] = self.count_by_type.get(signal_type, 0) + 1
+        if pos.get('is_live'):
+            self.n_live += 1
+
     def _save(self):
-        with open(POSITIONS_FILE, 'w') as f:
-            json.dump({'open': self.positions, 'closed': self.closed[-100:]}, f, indent=2)
+        # Only the last 100 closed positions are kept, in memory as well as on disk
+        del self.closed[:-100]
+        _atomic_write_json(POSITIONS_FILE, {'open': self.positions, 'closed': self.closed})
+
+    def flush(self):
+        """Write positions if add() or check() changed them since the last write.
+        Called by add() for live fills and by check() once per cycle, so a burst
+        of dry-run entries is one write."""
+        if self._dirty:
+            self._save()
+            self._dirty = False
 
     def add(self, signal, order_info=None):
-        signal_type = signal.get('signal_type', 'reversion')
+        signal_type = signal.signal_type
         hold_hours = IMPL_HOLD_HOURS if signal_type == 'implied_prob' else HOLD_HOURS
         pos = {
-            'ticker': signal['ticker'],
-            'event_ticker': signal.get('event_ticker', ''),
-            'title': signal['title'],
-            'fade_action': signal['fade_action'],
-            'fade_side': signal['fade_side'],
-            'entry_price': signal['entry_price'],
-            'pre_signal_price': signal['pre_signal_price'],
-            'price_move': signal['price_move'],
-            'n_small_trades': signal['n_small_trades'],
-            'retail_contracts': signal['retail_contracts'],
-            'entry_time': signal['signal_time'],
-            'exit_time': signal['signal_time'] + hold_hours * 3600,
+            'ticker': signal.ticker,
+            'event_ticker': signal.event_ticker,
+            'title': signal.title,
+            'fade_action': signal.fade_action,
+            'fade_side': signal.fade_side,
+            'entry_price': signal.entry_price,
+            'pre_signal_price': signal.pre_signal_price,
+            'price_move': signal.price_move,
+            'n_small_trades': signal.n_small_trades,
+            'retail_contracts': signal.retail_contracts,
+            'entry_time': signal.signal_time,
+            'exit_time': signal.signal_time + hold_hours * 3600,
             'status': 'open',
             'signal_type': signal_type,
         }
         if order_info:
-            pos['order_id'] = order_info.get('order_id', '')
-            pos['fill_price'] = order_info.get('fill_price', 0)
-            pos['fill_count'] = order_info.get('fill_count', 0)
-            pos['bet_dollars'] = order_info.get('bet_dollars', 0)
+            pos['order_id'] = order_info.order_id
+            pos['fill_price'] = order_info.fill_price
+            pos['fill_count'] = order_info.fill_count
+            pos['bet_dollars'] = order_info.bet_dollars
             pos['is_live'] = True
         else:
             pos['is_live'] = False
         self.positions.append(pos)
-        self._save()
+        self._index(pos)
+        self._dirty = True
+        # A real-money fill goes to disk before the next order is placed, so a
+        # kill mid-cycle can't orphan it; only dry-run records wait for flush()
+        if order_info and not order_info.dry_run:
+            self.flush()
 
     def event_exposure(self, event_ticker):
-        """Total dollars deployed on open positions for a given event."""
+        """Total dollars deployed (or reserved by in-flight orders) for a given event."""
         if not event_ticker:
             return 0
-        return sum(
-            pos.get('bet_dollars', 0)
-            for pos in self.positions
-            if pos.get('status') == 'open' and pos.get('event_ticker') == event_ticker
-        )
+        return self.reserved.get(event_ticker, 0) + self.exposure_by_event.get(event_ticker, 0)
+
+    @contextlib.contextmanager
+    def reserve(self, event_ticker, dollars):
+        """Count `dollars` toward event_exposure() while an entry order is in flight,
+        so the exposure check and the resulting position can't be interleaved."""
+        if not event_ticker:
+            yield
+            return
+        self.reserved[event_ticker] = self.reserved.get(event_ticker, 0) + dollars
+        try:
+            yield
+        finally:
+            self.reserved[event_ticker] -= dollars
+            if self.reserved[event_ticker] <= 0:
+                del self.reserved[event_ticker]
 
     def check(self, client):
         """Check for 24h expiry. Returns alerts list."""
@@ -955,17 +1609,20 @@ class KalshiPositionTracker:
         alerts = []
         still_open = []
 
+        # Only exiting positions need a price: refresh those in one batched request
+        expiring = {pos['ticker'] for pos in self.positions
+                    if pos['status'] == 'open' and now >= pos['exit_time']}
+        if expiring:
+            client.refresh_markets(expiring)
+
         for pos in self.positions:
             if pos['status'] != 'open':
                 continue
 
-            # Force-refresh the market cache for current price
-            client.market_cache.pop(pos['ticker'], None)
-            current = client.get_current_price(pos['ticker'])
-            roi = self._roi(pos, current)
-
             # 24h exit
             if now >= pos['exit_time']:
+                current = client.get_current_price(pos['ticker'])
+                roi = self._roi(pos, current)
                 pos['exit_price'] = current
                 pos['roi_pct'] = roi
                 pos['status'] = 'closed_24h'
@@ -976,26 +1633,26 @@ class KalshiPositionTracker:
 
             still_open.append(pos)
 
-        self.positions = still_open
-        self._save()
+        if len(still_open) != len(self.positions):
+            self.positions = still_open
+            self._reindex()
+            self._dirty = True
+        self.flush()
         return alerts
 
     def _roi(self, pos, current):
         if current is None:
             return None
         entry = pos.get('fill_price', pos['entry_price'])
-        if pos['fade_action'] == 'SELL':
-            return (entry - current) / entry * 100
-        else:
-            return (current - entry) / entry * 100
+        return FADE_PNL_SIGN.get(pos['fade_action'], 1) * (current - entry) / entry * 100
 
     def count(self, signal_type=None):
         if signal_type:
-            return sum(1 for p in self.positions if p.get('signal_type', 'reversion') == signal_type)
+            return self.count_by_type.get(signal_type, 0)
         return len(self.positions)
 
     def live_count(self):
-        return sum(1 for p in self.positions if p.get('is_live'))
+        return self.n_live
 
 
 # =====================================================================
@@ -1007,25 +1664,68 @@ class OrderExecutor:
         self.client = client
         self.logger = trade_logger
 
-    def execute_entry(self, signal):
+    def _wait_for_fill(self, order_id):
+        """Poll an order with backoff until it is fully filled or no longer resting,
+        or ORDER_WAIT_SECONDS elapse. Returns the last status seen (may be None)."""
+        deadline = time.monotonic() + ORDER_WAIT_SECONDS
+        status = None
+        for i in itertools.count():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(ORDER_POLL_DELAYS[min(i, len(ORDER_POLL_DELAYS) - 1)], remaining))
+            status = self.client.get_order(order_id) or status
+            if status and (status.get('remaining_count', 1) == 0
+                           or status.get('status') in ('executed', 'canceled')):
+                break
+        return status
+
+    def hint_slippage(self, signal):
+        """Slippage % implied by a recent cached market quote (or, failing that,
+        a recent trade from this scan), or None if neither is fresh. Used to
+        drop signals before fetching their orderbook."""
+        hint = self.client.quote_hint(signal.ticker)
+        if not hint:
+            last = self.client.trade_hint(signal.ticker)
+            if last is None:
+                return None
+            hint = (last, last)
+        entry_cents = int(signal.entry_price * 100)
+        if signal.fade_side == 'no':
+            best_ask, target = 100 - hint[0], 100 - entry_cents  # NO ask = 100 - YES bid
+        else:
+            best_ask, target = hint[1], entry_cents
+        if target <= 0:
+            return None
+        return (best_ask - target) / target * 100
+
+    def execute_entry(self, signal, max_bet=MAX_BET_DOLLARS):
         """
-        Place entry order for a signal. Returns order_info dict or None.
+        Place entry order for a signal, spending at most `max_bet` dollars.
+        Returns an OrderInfo or None.
         For SELL signals: buy NO contracts.
         For BUY signals: buy YES contracts.
+        The book comes from get_orderbook(), so a batch prefetch is reused only
+        while it is younger than ORDERBOOK_CACHE_TTL.
         """
-        ticker = signal['ticker']
-        entry_cents = int(signal['entry_price'] * 100)
-        order_side = signal.get('fade_side', 'no')  # 'no' for SELL fades, 'yes' for BUY fades
-
-        # Fetch orderbook
+        ticker = signal.ticker
+        entry_cents = int(signal.entry_price * 100)
+        order_side = signal.fade_side  # 'no' for SELL fades, 'yes' for BUY fades
+
+        # Fetch orderbook, unless a recent quote or trade already shows the price ran away
+        hint = self.hint_slippage(signal)
+        if hint is not None and hint > MAX_SLIPPAGE_PCT:
+            log.info("    STALE MOVE: recent price %+.1f%% past signal price (> %s%%), skipping",
+                     hint, MAX_SLIPPAGE_PCT)
+            return None
         orderbook = self.client.get_orderbook(ticker)
         if not orderbook:
-            print(f"    No orderbook for {ticker}, skipping")
+            log.info("    No orderbook for %s, skipping", ticker)
             return None
 
         if order_side == 'no':
             # Buy NO: derive NO asks from YES bids
-            contracts, best_ask_cents, uncapped_dollars = calculate_bet_size(orderbook, 'no', entry_cents)
+            contracts, best_ask_cents, uncapped_dollars = calculate_bet_size(orderbook, 'no', entry_cents, max_bet)
             target_price_cents = 100 - entry_cents  # NO price = 100 - YES price
             side_label = 'NO'
         else:
@@ -1036,30 +1736,28 @@ class OrderExecutor:
                 no_bids = no_bids.get('bids', [])
             if not no_bids:
                 # Fallback: just use entry price
-                contracts = max(1, int(IMPL_MAX_BET_DOLLARS / (entry_cents / 100)))
+                contracts = max(1, round(IMPL_MAX_BET_DOLLARS * 100) // entry_cents)
                 best_ask_cents = entry_cents
                 uncapped_dollars = IMPL_MAX_BET_DOLLARS
             else:
-                yes_asks = [[100 - b[0], b[1]] for b in no_bids]
-                asks_sorted = sorted(yes_asks, key=lambda x: x[0])
-                top_levels = asks_sorted[:3]
-                if not top_levels:
-                    print(f"    No YES ask levels for {ticker}, skipping")
+                # The highest NO bids are the cheapest YES asks
+                asks = _implied_asks(no_bids)
+                if not asks:
+                    log.info("    No YES ask levels for %s, skipping", ticker)
                     return None
-                best_ask_cents = top_levels[0][0]
-                depth_dollars = sum(l[0] * l[1] / 100 for l in top_levels)
+                best_ask_cents, depth_dollars = asks
                 uncapped_dollars = round(depth_dollars * DEPTH_FRACTION, 2)
-                bet_dollars_raw = min(uncapped_dollars, MAX_BET_DOLLARS)
+                bet_dollars_raw = min(uncapped_dollars, max_bet)
                 if bet_dollars_raw < MIN_BET_DOLLARS:
                     return None
-                contracts = int(bet_dollars_raw / (best_ask_cents / 100)) if best_ask_cents > 0 else 0
+                contracts = round(bet_dollars_raw * 100) // best_ask_cents if best_ask_cents > 0 else 0
                 if contracts < 1:
                     return None
             target_price_cents = entry_cents
             side_label = 'YES'
 
         if contracts < 1:
-            print(f"    Book too thin for {ticker} (min ${MIN_BET_DOLLARS}), skipping")
+            log.info("    Book too thin for %s (min $%s), skipping", ticker, MIN_BET_DOLLARS)
             return None
 
         bet_dollars = round(contracts * best_ask_cents / 100, 2)
@@ -1067,21 +1765,23 @@ class OrderExecutor:
         # Slippage check
         slippage_pct = (best_ask_cents - target_price_cents) / target_price_cents * 100 if target_price_cents > 0 else 0
         if slippage_pct > MAX_SLIPPAGE_PCT:
-            print(f"    SLIPPAGE: best {side_label} ask {best_ask_cents}c vs signal {target_price_cents}c "
-                  f"({slippage_pct:+.1f}% > {MAX_SLIPPAGE_PCT}%), skipping")
+            log.info("    SLIPPAGE: best %s ask %sc vs signal %sc (%+.1f%% > %s%%), skipping",
+                     side_label, best_ask_cents, target_price_cents, slippage_pct, MAX_SLIPPAGE_PCT)
             return None
 
-        capped_note = f" [depth: ${uncapped_dollars:.2f}, capped to ${MAX_BET_DOLLARS}]" if uncapped_dollars > MAX_BET_DOLLARS else ""
-        print(f"    Sizing: {contracts} {side_label} @ {best_ask_cents}c (signal {target_price_cents}c, slip {slippage_pct:+.1f}%) = ${bet_dollars:.2f}{capped_note}")
+        if log.isEnabledFor(logging.INFO):
+            capped_note = f" [depth: ${uncapped_dollars:.2f}, capped to ${max_bet}]" if uncapped_dollars > max_bet else ""
+            log.info("    Sizing: %s %s @ %sc (signal %sc, slip %+.1f%%) = $%.2f%s",
+                     contracts, side_label, best_ask_cents, target_price_cents, slippage_pct, bet_dollars, capped_note)
 
         if DRY_RUN:
-            order_info = {
-                'order_id': f'DRY-{uuid.uuid4().hex[:8]}',
-                'fill_price': signal['entry_price'],
-                'fill_count': contracts,
-                'bet_dollars': bet_dollars,
-                'dry_run': True,
-            }
+            order_info = OrderInfo(
+                order_id=f'DRY-{uuid.uuid4().hex[:8]}',
+                fill_price=signal.entry_price,
+                fill_count=contracts,
+                bet_dollars=bet_dollars,
+                dry_run=True,
+            )
             self.logger.record({
                 'type': 'entry',
                 'ticker': ticker,
@@ -1091,33 +1791,33 @@ class OrderExecutor:
                 'price_cents': target_price_cents,
                 'bet_dollars': bet_dollars,
                 'dry_run': True,
-                'signal': {k: v for k, v in signal.items() if k != 'title'},
+                'signal': signal.log_fields(),
             })
-            print(f"    DRY RUN: would buy {contracts} {side_label} @ {target_price_cents}c (${bet_dollars:.2f})")
+            log.info("    DRY RUN: would buy %s %s @ %sc ($%.2f)", contracts, side_label, target_price_cents, bet_dollars)
             return order_info
 
         # Max price we'll pay: signal price + slippage tolerance
         max_price = int(target_price_cents * (1 + MAX_SLIPPAGE_PCT / 100))
 
-        # Live order with retries -- track all placed order IDs so we can
-        # clean up any that are still resting if the loop exits without a fill.
-        placed_order_ids = []
+        # Live order with retries -- track placed order IDs not yet confirmed
+        # canceled, so one batch cancel can clean up whatever may still rest.
+        placed_order_ids = set()
 
         def _handle_fill(order_id, status, price):
-            """Process a filled/partially-filled order and return order_info."""
+            """Process a filled/partially-filled order and return its OrderInfo."""
             filled = status.get('quantity_filled', 0)
             remaining = status.get('remaining_count', contracts)
             avg_fill = status.get('average_fill_price', price)
             fill_slip = (avg_fill - target_price_cents) / target_price_cents * 100 if target_price_cents > 0 else 0
             actual_dollars = round(filled * avg_fill / 100, 2)
-            info = {
-                'order_id': order_id,
-                'fill_price': avg_fill / 100,
-                'fill_count': filled,
-                'bet_dollars': actual_dollars,
-                'slippage_pct': round(fill_slip, 2),
-                'dry_run': False,
-            }
+            info = OrderInfo(
+                order_id=order_id,
+                fill_price=avg_fill / 100,
+                fill_count=filled,
+                bet_dollars=actual_dollars,
+                dry_run=False,
+                slippage_pct=round(fill_slip, 2),
+            )
             self.logger.record({
                 'type': 'entry',
                 'ticker': ticker,
@@ -1135,23 +1835,25 @@ class OrderExecutor:
             })
             if remaining > 0:
                 self.client.cancel_order(order_id)
-            print(f"    FILLED: {filled}/{contracts} {side_label} @ avg {avg_fill}c "
-                  f"(slip {fill_slip:+.1f}%, ${actual_dollars:.2f})")
+            log.info("    FILLED: %s/%s %s @ avg %sc (slip %+.1f%%, $%.2f)",
+                     filled, contracts, side_label, avg_fill, fill_slip, actual_dollars)
             return info
 
+        # Per-signal dollar cap, in cents so each retry's contract count is exact
+        max_cost_cents = round(max_bet * 100)
+
         for attempt in range(MAX_ORDER_RETRIES + 1):
             price = best_ask_cents + attempt  # Start at best ask, bump 1c each retry
             if price > max_price:
-                print(f"    Price {price}c exceeds max {max_price}c ({MAX_SLIPPAGE_PCT:.0f}% slip), stopping")
+                log.info("    Price %sc exceeds max %sc (%.0f%% slip), stopping", price, max_price, MAX_SLIPPAGE_PCT)
                 break
             if price >= 99:
                 break
 
-            # Re-derive contract count at this price so dollar cost stays <= MAX_BET_DOLLARS
-            max_dollars = IMPL_MAX_BET_DOLLARS if signal.get('signal_type') == 'implied_prob' else MAX_BET_DOLLARS
-            retry_contracts = min(contracts, int(max_dollars / (price / 100))) if price > 0 else contracts
+            # Re-derive contract count at this price so dollar cost stays <= max_bet
+            retry_contracts = min(contracts, max_cost_cents // price) if price > 0 else contracts
             if retry_contracts < 1:
-                print(f"    Price {price}c too high to buy even 1 contract within ${max_dollars}, stopping")
+                log.info("    Price %sc too high to buy even 1 contract within $%s, stopping", price, max_bet)
                 break
 
             order = self.client.create_order(
@@ -1162,51 +1864,55 @@ class OrderExecutor:
                 price_cents=price,
             )
             if not order:
-                print(f"    Order failed (attempt {attempt + 1})")
+                log.info("    Order failed (attempt %s)", attempt + 1)
                 continue
 
             order_id = order.get('order_id', '')
-            placed_order_ids.append(order_id)
-            print(f"    Order placed: {order_id} ({retry_contracts} {side_label} @ {price}c, ${retry_contracts * price / 100:.2f})")
+            if order_id:
+                placed_order_ids.add(order_id)
+            log.info("    Order placed: %s (%s %s @ %sc, $%.2f)",
+                     order_id, retry_contracts, side_label, price, retry_contracts * price / 100)
 
             # Wait for fill
-            time.sleep(ORDER_WAIT_SECONDS)
-
-            # Check fill status
-            status = self.client.get_order(order_id)
+            status = self._wait_for_fill(order_id)
             if status:
                 filled = status.get('quantity_filled', 0)
 
                 if filled > 0:
                     # Cancel any earlier resting orders before returning
-                    for prev_id in placed_order_ids:
-                        if prev_id != order_id:
-                            self.client.cancel_order(prev_id)
+                    self.client.batch_cancel_orders(list(placed_order_ids - {order_id}))
                     return _handle_fill(order_id, status, price)
                 else:
-                    # Not filled -- cancel and verify it's actually canceled
-                    canceled = self.client.cancel_order(order_id)
-                    if not canceled:
-                        print(f"    Cancel may have failed for {order_id}, re-checking...")
-                    # Re-check: order may have filled between our check and cancel
-                    time.sleep(0.5)
-                    recheck = self.client.get_order(order_id)
+                    # Not filled -- cancel. The cancel response is the order's final
+                    # state, so a fill between our check and the cancel shows up there
+                    # without a second poll.
+                    recheck = self.client.cancel_and_fetch(order_id)
+                    if recheck is not None:
+                        # Confirmed canceled: nothing left for the cleanup batch
+                        placed_order_ids.discard(order_id)
+                    if not recheck:
+                        if recheck is None:
+                            log.info("    Cancel may have failed for %s, re-checking...", order_id)
+                        time.sleep(0.5)
+                        recheck = self.client.get_order(order_id)
                     if recheck and recheck.get('quantity_filled', 0) > 0:
-                        print(f"    Late fill detected on {order_id}")
-                        for prev_id in placed_order_ids:
-                            if prev_id != order_id:
-                                self.client.cancel_order(prev_id)
+                        log.info("    Late fill detected on %s", order_id)
+                        self.client.batch_cancel_orders(list(placed_order_ids - {order_id}))
                         return _handle_fill(order_id, recheck, price)
-                    print(f"    Not filled at {price}c, retrying...")
+                    log.info("    Not filled at %sc, retrying...", price)
 
         # Loop exited without a fill -- cancel ALL resting orders to prevent
         # late fills that would exceed the $50 max bet.
-        for oid in placed_order_ids:
-            self.client.cancel_order(oid)
-            time.sleep(0.2)
-        print(f"    Failed to fill after {MAX_ORDER_RETRIES + 1} attempts (all orders canceled)")
+        self.client.batch_cancel_orders(list(placed_order_ids))
+        log.info("    Failed to fill after %s attempts (all orders canceled)", MAX_ORDER_RETRIES + 1)
         return None
 
+    @staticmethod
+    def _exit_pnl(pos, exit_price, contracts):
+        """Dollar P&L of closing `contracts` at `exit_price`."""
+        move = exit_price - pos.get('fill_price', pos['entry_price'])
+        return FADE_PNL_SIGN.get(pos['fade_action'], 1) * move * contracts
+
     def execute_exit(self, pos):
         """
         Place exit order for a position. Returns actual exit info.
@@ -1225,7 +1931,7 @@ class OrderExecutor:
             current = self.client.get_current_price(ticker)
             entry_price = pos.get('fill_price', pos['entry_price'])
             if current and entry_price:
-                pnl = (entry_price - current) * contracts if pos['fade_action'] == 'SELL' else (current - entry_price) * contracts
+                pnl = self._exit_pnl(pos, current, contracts)
             else:
                 pnl = 0
             self.logger.record({
@@ -1237,7 +1943,7 @@ class OrderExecutor:
                 'actual_pnl_dollars': round(pnl, 2),
                 'dry_run': True,
             })
-            print(f"    DRY RUN: would sell {contracts} {side_label} (P&L: ${pnl:.2f})")
+            log.info("    DRY RUN: would sell %s %s (P&L: $%.2f)", contracts, side_label, pnl)
             return {'exit_price': current, 'pnl': round(pnl, 2)}
 
         orderbook = self.client.get_orderbook(ticker)
@@ -1248,8 +1954,9 @@ class OrderExecutor:
             if isinstance(yes_asks, dict):
                 yes_asks = yes_asks.get('asks', [])
             if yes_asks:
-                best_yes_ask = min(a[0] for a in yes_asks)
-                sell_price = max(1, (100 - best_yes_ask) - 1)
+                # min() over [price, qty] levels orders by price first: one C-level scan
+                best_yes_ask = min(yes_asks)[0]
+                sell_price = max(1, 99 - best_yes_ask)
             else:
                 current = self.client.get_current_price(ticker)
                 sell_price = max(1, int((1 - current) * 100) - 1) if current else 1
@@ -1260,7 +1967,7 @@ class OrderExecutor:
             if isinstance(yes_bids, dict):
                 yes_bids = yes_bids.get('bids', [])
             if yes_bids:
-                best_yes_bid = max(b[0] for b in yes_bids)
+                best_yes_bid = max(yes_bids)[0]
                 sell_price = max(1, best_yes_bid - 1)
             else:
                 current = self.client.get_current_price(ticker)
@@ -1275,13 +1982,11 @@ class OrderExecutor:
         )
         if order:
             order_id = order.get('order_id', '')
-            time.sleep(ORDER_WAIT_SECONDS)
-            status = self.client.get_order(order_id)
+            status = self._wait_for_fill(order_id)
             filled = status.get('quantity_filled', 0) if status else 0
             avg_fill = status.get('average_fill_price', sell_price) if status else sell_price
 
-            entry_price = pos.get('fill_price', pos['entry_price'])
-            pnl = round((entry_price - avg_fill / 100) * filled, 2) if pos['fade_action'] == 'SELL' else round((avg_fill / 100 - entry_price) * filled, 2)
+            pnl = round(self._exit_pnl(pos, avg_fill / 100, filled), 2)
 
             self.logger.record({
                 'type': 'exit',
@@ -1295,10 +2000,10 @@ class OrderExecutor:
                 'actual_pnl_dollars': pnl,
                 'dry_run': False,
             })
-            print(f"    EXIT FILLED: {filled}/{contracts} {side_label} @ {avg_fill}c (P&L: ${pnl:.2f})")
+            log.info("    EXIT FILLED: %s/%s %s @ %sc (P&L: $%.2f)", filled, contracts, side_label, avg_fill, pnl)
             return {'exit_price': avg_fill / 100, 'pnl': pnl}
 
-        print(f"    EXIT FAILED for {ticker}")
+        log.info("    EXIT FAILED for %s", ticker)
         return None
 
 
@@ -1308,48 +2013,57 @@ class OrderExecutor:
 
 class KalshiNotifier:
     def __init__(self):
-        self.bot = Bot(token=TELEGRAM_BOT_TOKEN) if TELEGRAM_BOT_TOKEN else None
-
-    async def send_signal(self, sig, order_info=None):
-        entry_cents = int(sig['entry_price'] * 100)
-        exit_time = datetime.fromtimestamp(
-            sig['signal_time'] + HOLD_HOURS * 3600, tz=timezone.utc
-        ).strftime('%b %d %H:%M UTC')
-
-        move_dir = "pushed YES up" if sig['dominant_side'] == 'yes' else "pushed NO up"
+        # Bot's default request pool holds a single connection, which would
+        # serialize the background alert tasks sent after a busy scan.
+        self.bot = Bot(
+            token=TELEGRAM_BOT_TOKEN,
+            request=HTTPXRequest(
+                connection_pool_size=TELEGRAM_POOL_SIZE,
+                connect_timeout=2.0,
+                read_timeout=5.0,
+            ),
+        ) if TELEGRAM_BOT_TOKEN else None
+
+    _TRADE_LINE = "\n{prefix} {count} {side} @ {cents}c (${dollars:.2f})"
+
+    @classmethod
+    def _trade_line(cls, order_info, fade_side):
+        """Order summary line shared by the entry alerts."""
+        if not order_info:
+            return "\n(Signal only -- no order placed)"
+        return cls._TRADE_LINE.format(
+            prefix='[DRY RUN] Would buy' if order_info.dry_run else 'ORDER FILLED:',
+            count=order_info.fill_count,
+            side='NO' if fade_side == 'no' else 'YES',
+            cents=int(order_info.fill_price * 100),
+            dollars=order_info.bet_dollars,
+        )
 
-        if sig['fade_side'] == 'yes':
-            action = f"BUY YES at {entry_cents}c"
-        else:
-            action = f"BUY NO at {100 - entry_cents}c"
+    @staticmethod
+    def _action(sig, entry_cents):
+        if sig.fade_side == 'yes':
+            return f"BUY YES at {entry_cents}c"
+        return f"BUY NO at {100 - entry_cents}c"
 
-        url = f"\nhttps://kalshi.com/markets/{sig['ticker']}"
+    async def send_signal(self, sig, order_info=None):
+        entry_cents = int(sig.entry_price * 100)
+        exit_time = _exit_time_str(sig.signal_time, HOLD_HOURS)
 
-        # Trading info
-        if order_info:
-            if order_info.get('dry_run'):
-                trade_line = (
-                    f"\n[DRY RUN] Would buy {order_info['fill_count']} NO "
-                    f"@ {int(order_info['fill_price']*100)}c (${order_info['bet_dollars']:.2f})"
-                )
-            else:
-                trade_line = (
-                    f"\nORDER FILLED: {order_info['fill_count']} NO "
-                    f"@ {int(order_info['fill_price']*100)}c (${order_info['bet_dollars']:.2f})"
-                )
-        else:
-            trade_line = "\n(Signal only — no order placed)"
+        move_dir = "pushed YES up" if sig.dominant_side == 'yes' else "pushed NO up"
+        action = self._action(sig, entry_cents)
+        trade_line = self._trade_line(order_info, sig.fade_side)
+        url = f"\nhttps://kalshi.com/markets/{sig.ticker}"
 
         msg = (
             f"KALSHI RETAIL REVERSION\n\n"
-            f"{sig['title']}\n"
-            f"Ticker: {sig['ticker']}\n\n"
+            f"{sig.title}\n"
+            f"Ticker: {sig.ticker}\n\n"
             f"ACTION: {action}\n\n"
             f"Yes price: {entry_cents}c\n"
             f"Exit: {exit_time} (24h hold)\n\n"
-            f"Why: {sig['n_small_trades']} small trades {move_dir} "
-            f"by {abs(sig['price_move'])*100:.0f}c in 1hr "
-            f"({sig['retail_contracts']:,} contracts). Fading the crowd.\n\n"
+            f"Why: {sig.n_small_trades} small trades {move_dir} "
+            f"by {abs(sig.price_move)*100:.0f}c in 1hr "
+            f"({sig.retail_contracts:,} contracts). Fading the crowd.\n\n"
             f"Backtest (60d): 58% WR, +27% avg ROI"
             f"{trade_line}"
             f"{url}"
@@ -1357,41 +2071,19 @@ class KalshiNotifier:
         await self._send(msg)
 
     async def send_impl_prob_signal(self, sig, order_info=None):
-        entry_cents = int(sig['entry_price'] * 100)
-        exit_time = datetime.fromtimestamp(
-            sig['signal_time'] + IMPL_HOLD_HOURS * 3600, tz=timezone.utc
-        ).strftime('%b %d %H:%M UTC')
-
-        if sig['fade_side'] == 'yes':
-            action = f"BUY YES at {entry_cents}c"
-        else:
-            action = f"BUY NO at {100 - entry_cents}c"
-
-        url = f"\nhttps://kalshi.com/markets/{sig['ticker']}"
-
-        if order_info:
-            if order_info.get('dry_run'):
-                trade_line = (
-                    f"\n[DRY RUN] Would buy {order_info['fill_count']} "
-                    f"{'NO' if sig['fade_side'] == 'no' else 'YES'} "
-                    f"@ {int(order_info['fill_price']*100)}c (${order_info['bet_dollars']:.2f})"
-                )
-            else:
-                trade_line = (
-                    f"\nORDER FILLED: {order_info['fill_count']} "
-                    f"{'NO' if sig['fade_side'] == 'no' else 'YES'} "
-                    f"@ {int(order_info['fill_price']*100)}c (${order_info['bet_dollars']:.2f})"
-                )
-        else:
-            trade_line = "\n(Signal only -- no order placed)"
+        entry_cents = int(sig.entry_price * 100)
+        exit_time = _exit_time_str(sig.signal_time, IMPL_HOLD_HOURS)
+        action = self._action(sig, entry_cents)
+        trade_line = self._trade_line(order_info, sig.fade_side)
+        url = f"\nhttps://kalshi.com/markets/{sig.ticker}"
 
         msg = (
             f"KALSHI IMPLIED PROB VIOLATION\n\n"
-            f"{sig['title']}\n"
-            f"Ticker: {sig['ticker']}\n\n"
+            f"{sig.title}\n"
+            f"Ticker: {sig.ticker}\n\n"
             f"ACTION: {action}\n\n"
-            f"Prob sum: ${sig['prob_sum']:.2f} across {sig['n_outcomes']} outcomes "
-            f"(deviation: {sig['deviation']:+.2f})\n"
+            f"Prob sum: ${sig.prob_sum:.2f} across {sig.n_outcomes} outcomes "
+            f"(deviation: {sig.deviation:+.2f})\n"
             f"Exit: {exit_time} (12h hold)\n\n"
             f"Backtest (60d Kalshi): 70.7% WR, +17.9% avg PnL"
             f"{trade_line}"
@@ -1466,6 +2158,7 @@ class KalshiReversionScanner:
         self.notifier = KalshiNotifier()
         self.trade_logger = TradeLogger()
         self.executor = OrderExecutor(self.client, self.trade_logger)
+        self._tg_tasks = set()  # in-flight notifications; strong refs so they aren't GC'd
 
     async def run(self):
         mode = "DRY RUN" if DRY_RUN else "LIVE"
@@ -1488,7 +2181,12 @@ class KalshiReversionScanner:
             else:
                 print("WARNING: Could not fetch balance — check API keys")
 
-        await self.notifier.send_startup(self.positions.count(), balance)
+        # Startup notice goes out in the background like every other alert,
+        # so the first scan doesn't wait on a Telegram round trip
+        self._notify(self.notifier.send_startup(self.positions.count(), balance))
+
+        # Runs whenever the cycle awaits: between scans and while orders are worked
+        self._keepalive_task = asyncio.create_task(self._keepalive())
 
         while True:
             try:
@@ -1504,9 +2202,26 @@ class KalshiReversionScanner:
                 traceback.print_exc()
                 await asyncio.sleep(60)
 
+    async def _keepalive(self):
+        while True:
+            await asyncio.sleep(KEEPALIVE_INTERVAL_SECONDS)
+            await asyncio.to_thread(self.client.ping)
+
+    def _notify(self, coro):
+        """Send a Telegram notification in the background. Alerts are advisory,
+        so the cycle never waits on Telegram before placing the next order."""
+        task = asyncio.create_task(coro)
+        self._tg_tasks.add(task)
+        task.add_done_callback(self._tg_done)
+
+    def _tg_done(self, task):
+        self._tg_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            print(f"  Telegram notify error: {task.exception()}")
+
     async def _cycle(self):
         now = time.time()
-        now_str = datetime.fromtimestamp(now, tz=timezone.utc).strftime('%Y-%m-%d %H:%M UTC')
+        now_str = time.strftime('%Y-%m-%d %H:%M UTC', time.gmtime(now))
         print(f"\n[{now_str}] Scan cycle")
 
         reversion_allowed = True
@@ -1527,30 +2242,45 @@ class KalshiReversionScanner:
         print(f"  Trades fetched: {len(trades)}")
 
         if trades:
-            tickers = set(t.get('ticker', '') for t in trades)
-            allowed = [t for t in tickers if self.client.is_allowed_ticker(t)]
-            print(f"  Unique markets: {len(tickers)}, allowed: {len(allowed)}")
+            tickers = {t.get('ticker', '') for t in trades}
+            self.client.prefetch_categories(tickers)
+            print(f"  Unique markets: {len(tickers)}")
+            # Diagnostic only: skip the per-ticker category pass unless debugging
+            if api_log.isEnabledFor(logging.DEBUG):
+                api_log.debug('  Allowed markets: %d', sum(1 for t in tickers if self.client.is_allowed_ticker(t)))
 
             # 2. Detect signals
             signals = self.detector.detect(trades, self.client, now)
             print(f"  Signals: {len(signals)}")
 
+            # Warm the orderbook cache in parallel rather than one fetch per
+            # entry; entries that run after ORDERBOOK_CACHE_TTL refetch their book
+            if signals and reversion_allowed and self.client.can_trade:
+                self.client.get_orderbooks({
+                    sig.ticker for sig in signals
+                    if (self.executor.hint_slippage(sig) or 0) <= MAX_SLIPPAGE_PCT
+                })
+
             for sig in signals:
-                entry_c = int(sig['entry_price'] * 100)
-                print(f"  SIGNAL: {sig['fade_action']} '{sig['title'][:50]}' @ {entry_c}c "
-                      f"(move {sig['price_move']:+.3f}, {sig['n_small_trades']} trades)")
+                entry_c = int(sig.entry_price * 100)
+                print(f"  SIGNAL: {sig.fade_action} '{sig.title[:50]}' @ {entry_c}c "
+                      f"(move {sig.price_move:+.3f}, {sig.n_small_trades} trades)")
 
                 order_info = None
-                event = sig.get('event_ticker', '')
+                event = sig.event_ticker
                 exposure = self.positions.event_exposure(event)
                 if exposure >= MAX_BET_DOLLARS and event:
                     print(f"    EVENT CAP: already ${exposure:.2f} on {event} (max ${MAX_BET_DOLLARS}), skipping")
                 elif reversion_allowed and self.client.can_trade:
-                    order_info = self.executor.execute_entry(sig)
+                    # Fill polling sleeps; run it off the event loop so queued
+                    # Telegram sends and the keepalive ping aren't held up
+                    with self.positions.reserve(event, MAX_BET_DOLLARS):
+                        order_info = await asyncio.to_thread(self.executor.execute_entry, sig)
+                        if order_info:
+                            self.positions.add(sig, order_info)
 
                 if order_info:
-                    await self.notifier.send_signal(sig, order_info)
-                    self.positions.add(sig, order_info)
+                    self._notify(self.notifier.send_signal(sig, order_info))
 
         # 3. Implied probability violation scan
         print(f"  Scanning implied probability violations...")
@@ -1560,14 +2290,20 @@ class KalshiReversionScanner:
             impl_signals = self.impl_detector.detect(all_open_markets, self.client, now)
             print(f"  Impl prob signals: {len(impl_signals)}")
 
+            if impl_signals and impl_allowed and self.client.can_trade:
+                self.client.get_orderbooks({
+                    sig.ticker for sig in impl_signals
+                    if (self.executor.hint_slippage(sig) or 0) <= MAX_SLIPPAGE_PCT
+                })
+
             for sig in impl_signals:
-                entry_c = int(sig['entry_price'] * 100)
-                print(f"  IMPL PROB: {sig['fade_action']} '{sig['title'][:50]}' @ {entry_c}c "
-                      f"(sum={sig['prob_sum']:.2f}, dev={sig['deviation']:+.2f}, "
-                      f"{sig['n_outcomes']} outcomes)")
+                entry_c = int(sig.entry_price * 100)
+                print(f"  IMPL PROB: {sig.fade_action} '{sig.title[:50]}' @ {entry_c}c "
+                      f"(sum={sig.prob_sum:.2f}, dev={sig.deviation:+.2f}, "
+                      f"{sig.n_outcomes} outcomes)")
 
                 order_info = None
-                event = sig.get('event_ticker', '')
+                event = sig.event_ticker
                 exposure = self.positions.event_exposure(event)
                 if exposure >= IMPL_MAX_BET_DOLLARS and event:
                     print(f"    EVENT CAP: already ${exposure:.2f} on {event} "
@@ -1575,15 +2311,14 @@ class KalshiReversionScanner:
                 elif not impl_allowed:
                     print(f"    MAX IMPL POSITIONS reached, skipping")
                 elif self.client.can_trade:
-                    # Use impl prob bet sizing: override MAX_BET temporarily
-                    saved_max = globals()['MAX_BET_DOLLARS']
-                    globals()['MAX_BET_DOLLARS'] = IMPL_MAX_BET_DOLLARS
-                    order_info = self.executor.execute_entry(sig)
-                    globals()['MAX_BET_DOLLARS'] = saved_max
+                    with self.positions.reserve(event, IMPL_MAX_BET_DOLLARS):
+                        order_info = await asyncio.to_thread(
+                            self.executor.execute_entry, sig, IMPL_MAX_BET_DOLLARS)
+                        if order_info:
+                            self.positions.add(sig, order_info)
 
                 if order_info:
-                    await self.notifier.send_impl_prob_signal(sig, order_info)
-                    self.positions.add(sig, order_info)
+                    self._notify(self.notifier.send_impl_prob_signal(sig, order_info))
         except Exception as e:
             print(f"  Impl prob scan error: {e}")
             import traceback
@@ -1594,17 +2329,19 @@ class KalshiReversionScanner:
         for atype, pos in alerts:
             exit_info = None
             if pos.get('is_live') and self.client.can_trade:
-                exit_info = self.executor.execute_exit(pos)
+                exit_info = await asyncio.to_thread(self.executor.execute_exit, pos)
 
             if atype == '24h_exit':
                 print(f"  24h EXIT: '{pos['title'][:50]}' ROI: {pos.get('roi_pct',0):+.1f}%")
-                await self.notifier.send_24h_exit(pos, exit_info)
+                self._notify(self.notifier.send_24h_exit(pos, exit_info))
 
         print(f"  Open positions: {self.positions.count()} (rev={self.positions.count('reversion')}, impl={self.positions.count('implied_prob')}, {self.positions.live_count()} live)")
         daily_pnl = self.trade_logger.daily_pnl()
         if daily_pnl != 0:
             print(f"  Daily P&L: ${daily_pnl:.2f}")
 
+        self.client.save_cache()
+
 
 if __name__ == "__main__":
     scanner = KalshiReversionScanner()